@@ -1,28 +1,41 @@
 from abc import ABC, ABCMeta, abstractmethod
 from typing import Any, Dict, Iterable, List
+from weakref import WeakValueDictionary
 
 
 class SingletoneMeta(ABCMeta):
     """Metaclass for the singletone pattern."""
 
-    _instances = {}
+    # Instances are held weakly, so clients that are no longer used can be garbage collected
+    _instances: WeakValueDictionary = WeakValueDictionary()
 
     def __call__(cls, *args, **kwargs):
         """
         Return the instance if it exists, otherwise create a new one.
-        Instances are stored in a dictionary with the key being a tuple of the arguments and the class.
+        Instances are stored in a dictionary with the key being a tuple of the class and the arguments.
         In other words, it's possible to have only one instance with specific table name and child class.
+        A table name passed positionally or by keyword resolves to the same instance.
         """
 
-        key = (args, frozenset(kwargs.items()), cls)
-        if key not in cls._instances:
-            cls._instances[key] = super(SingletoneMeta, cls).__call__(*args, **kwargs)
-        return cls._instances[key]
+        if not kwargs and len(args) == 1:
+            key = (cls, args[0])
+        elif not args and kwargs.keys() == {'table_name'}:
+            key = (cls, kwargs['table_name'])
+        else:
+            key = (cls, args, tuple(sorted(kwargs.items())))
+        try:
+            return cls._instances[key]
+        except KeyError:
+            instance = cls._instances[key] = super(SingletoneMeta, cls).__call__(*args, **kwargs)
+            return instance
 
 
 class BaseClient(ABC, metaclass=SingletoneMeta):
     """Base client for all clients."""
 
+    # Instances must stay weak-referenceable for the SingletoneMeta instance map
+    __slots__ = ('table_name', '__weakref__')
+
     def __init__(self, table_name: str) -> None:
         """Initialize the client with the table name."""
         self.table_name = table_name
@@ -40,34 +53,91 @@ class BaseClient(ABC, metaclass=SingletoneMeta):
         """
         raise NotImplementedError
 
+    def bulk_insert(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Bulk insert new records into the table.
+        By default the records are inserted one by one, clients can override it with a single request.
+
+        Args:
+            data (List[Dict[str, Any]]): The data to insert.
+
+        Returns:
+            (List[Dict[str, Any]]): List of inserted records.
+        """
+
+        return [self.insert(record) for record in data]
+
     @abstractmethod
-    def update(self, *, id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    def update(self, *, id: int, data: Dict[str, Any], returning: bool = True) -> Dict[str, Any] | None:
         """
         Update a record in the table.
 
         Args:
             id (int): The ID of the record to update.
             data (Dict[str, Any]): The data to update.
+            returning (bool): Whether to return the updated record.
 
         Returns:
-            (Dict[str, Any]): The updated record.
+            (Dict[str, Any] | None): The updated record, or None if it's not returned.
         """
         raise NotImplementedError
 
     @abstractmethod
-    def select(self, *, eq: Dict[str, Any] | None = None, neq: Dict[str, Any] | None = None) -> List[Dict[str, Any]]:
+    def select(
+        self,
+        *,
+        eq: Dict[str, Any] | None = None,
+        neq: Dict[str, Any] | None = None,
+        limit: int | None = None,
+        columns: Iterable[str] | None = None,
+        order_by: str | None = None,
+    ) -> List[Dict[str, Any]]:
         """
         Select records from the table.
 
         Args:
             eq (Dict[str, Any] | None): The equality filter.
             neq (Dict[str, Any] | None): The non-equality filter.
+            limit (int | None): The maximum number of records to select.
+            columns (Iterable[str] | None): The columns to select, all columns if None.
+            order_by (str | None): The column to order the records by, prefixed with '-' for descending order.
 
         Returns:
             (List[Dict[str, Any]]): The selected records.
         """
         raise NotImplementedError
 
+    def count(self, *, eq: Dict[str, Any] | None = None, neq: Dict[str, Any] | None = None) -> int:
+        """
+        Count records in the table.
+        By default the matching records are selected and counted, clients can override it to count them in place.
+
+        Args:
+            eq (Dict[str, Any] | None): The equality filter.
+            neq (Dict[str, Any] | None): The non-equality filter.
+
+        Returns:
+            (int): The number of matching records.
+        """
+
+        return len(self.select(eq=eq, neq=neq))
+
+    def select_in(self, *, column: str, values: Iterable[Any]) -> List[Dict[str, Any]]:
+        """
+        Select records whose column value is one of the given values.
+        By default all records are selected and filtered, clients can override it to filter them in place.
+
+        Args:
+            column (str): The column to filter by.
+            values (Iterable[Any]): The accepted column values.
+
+        Returns:
+            (List[Dict[str, Any]]): The selected records.
+        """
+
+        values = list(values)
+        return [record for record in self.select() if record.get(column) in values]
+
     @abstractmethod
     def delete(self, *, id: int) -> None:
         """
@@ -92,6 +162,73 @@ class BaseClient(ABC, metaclass=SingletoneMeta):
         """
         raise NotImplementedError
 
+    def update_where(
+        self,
+        *,
+        data: Dict[str, Any],
+        eq: Dict[str, Any] | None = None,
+        neq: Dict[str, Any] | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Update the records matching the filters.
+        By default the matching records are selected and updated by their IDs.
+
+        Args:
+            data (Dict[str, Any]): The data to update.
+            eq (Dict[str, Any] | None): The equality filter.
+            neq (Dict[str, Any] | None): The non-equality filter.
+
+        Returns:
+            (List[Dict[str, Any]]): List of updated records.
+        """
+
+        ids = [record['id'] for record in self.select(eq=eq, neq=neq)]
+        return self.bulk_update(ids=ids, data=data) if ids else []
+
+    def bulk_upsert(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Bulk insert or update records with IDs, each with its own data.
+        By default existing records are updated and the other ones are inserted one by one.
+
+        Args:
+            data (List[Dict[str, Any]]): The records to save, including their IDs.
+
+        Returns:
+            (List[Dict[str, Any]]): List of saved records.
+        """
+
+        existing_ids = {record['id'] for record in self.select_in(column='id', values=[r['id'] for r in data])}
+
+        result = []
+        for record in data:
+            if record['id'] in existing_ids:
+                update_data = {key: value for key, value in record.items() if key != 'id'}
+                result.append(self.update(id=record['id'], data=update_data))
+            else:
+                result.append(self.insert(record))
+        return result
+
+    def delete_where(
+        self,
+        *,
+        eq: Dict[str, Any] | None = None,
+        neq: Dict[str, Any] | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Delete the records matching the filters.
+        By default the matching records are selected and deleted by their IDs.
+
+        Args:
+            eq (Dict[str, Any] | None): The equality filter.
+            neq (Dict[str, Any] | None): The non-equality filter.
+
+        Returns:
+            (List[Dict[str, Any]]): List of deleted records.
+        """
+
+        ids = [record['id'] for record in self.select(eq=eq, neq=neq)]
+        return self.bulk_delete(ids=ids) if ids else []
+
     @abstractmethod
     def bulk_delete(self, *, ids: Iterable[int]) -> List[Dict[str, Any]]:
         """
@@ -1,41 +1,325 @@
-from copy import copy
-from typing import Any, Dict, Iterable, List
+from collections import OrderedDict, defaultdict
+from itertools import count
+from operator import itemgetter
+from typing import Any, DefaultDict, Dict, Iterable, Iterator, List, Set, Tuple
+
+from typing_extensions import Self
 
 from .base import BaseClient
 
 
+# The maximum number of filter results kept by CacheClient.select
+_QUERY_CACHE_SIZE = 128
+
+# Types that Supabase returns as strings
+_STR_CONVERT_TYPES = (list, tuple)
+
+
+class _Records(Dict[int, Dict[str, Any]]):
+    """
+    The records of a CacheClient, keyed by ID.
+    Records set or removed from outside the client, e.g. to seed the cache in tests, are remembered
+    with the records they replace, so the client can reindex them before its next operation.
+    The client changes the records with store and remove, which aren't remembered.
+    """
+
+    __slots__ = ('seeded',)
+
+    _MISSING = object()
+
+    def __init__(self, records: Dict[int, Dict[str, Any]]) -> None:
+        super().__init__(records)
+        self.seeded: List[Tuple[int, Dict[str, Any] | None]] = []
+
+    def __setitem__(self, _id: int, record: Dict[str, Any]) -> None:
+        self.seeded.append((_id, self.get(_id)))
+        super().__setitem__(_id, record)
+
+    def __delitem__(self, _id: int) -> None:
+        self.seeded.append((_id, self[_id]))
+        super().__delitem__(_id)
+
+    def __ior__(self, records: Any) -> Self:
+        self.update(records)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for _id, record in dict(*args, **kwargs).items():
+            self[_id] = record
+
+    def setdefault(self, _id: int, record: Dict[str, Any]) -> Dict[str, Any]:  # pyright: ignore
+        if _id not in self:
+            self[_id] = record
+        return self[_id]
+
+    def pop(self, _id: int, default: Any = _MISSING) -> Any:
+        if _id not in self:
+            if default is self._MISSING:
+                raise KeyError(_id)
+            return default
+
+        record = self[_id]
+        del self[_id]
+        return record
+
+    def popitem(self) -> Tuple[int, Dict[str, Any]]:
+        _id, record = super().popitem()
+        self.seeded.append((_id, record))
+        return _id, record
+
+    def clear(self) -> None:
+        self.seeded.extend(self.items())
+        super().clear()
+
+    def store(self, _id: int, record: Dict[str, Any]) -> None:
+        """Set a record that the client indexes itself."""
+        super().__setitem__(_id, record)
+
+    def remove(self, _id: int) -> Dict[str, Any]:
+        """Remove a record that the client unindexes itself."""
+        return super().pop(_id)
+
+
 class CacheClient(BaseClient):
-    """Client for caching data in memory."""
+    """
+    Client for caching data in memory.
+    Records are stored and returned as copies, so changing them outside the client doesn't affect the cache.
+    """
+
+    __slots__ = ('_records', '_ids', '_indexes', '_query_cache')
+
+    _records: _Records
+    _ids: Iterator[int]
+    _indexes: DefaultDict[str, DefaultDict[Any, Set[int]]]
+    _query_cache: OrderedDict[Tuple[tuple, tuple], List[int]]
 
     def __init__(self, table_name: str) -> None:
         """Initialize the client with the table name."""
         super().__init__(table_name=table_name)
 
         # The cache of records
-        self._cache: Dict[int, dict] = {}
+        self._cache = {}
+
+    @property
+    def _cache(self) -> Dict[int, Dict[str, Any]]:
+        """The cache of records, keyed by ID."""
+        return self._records
 
-    def _get_return_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @_cache.setter
+    def _cache(self, records: Dict[int, Dict[str, Any]]) -> None:
         """
-        Get the return data for a record.
-        Supabase returns iterables as strings, so we need to convert them back.
+        Replace the cache of records.
+        New IDs continue after the highest seeded one.
+        Records can also be seeded or removed by item, they're reindexed before the next operation.
 
         Args:
-            data (Dict[str, Any]): The record data.
+            records (Dict[int, Dict[str, Any]]): The records to seed the cache with.
+        """
+        self._records = _Records(records)
+
+        # Monotonic ID generator, next() on it is a single atomic C call
+        self._ids = count(max(records, default=0) + 1)
+
+        # Per-column hash indexes: {column: {value: {ids}}}
+        self._indexes = defaultdict(lambda: defaultdict(set))
+        for _id, record in records.items():
+            self._index(_id, record)
+
+        # LRU of the IDs matching recently selected filters, cleared on every write
+        self._query_cache = OrderedDict()
+
+    def _sync(self) -> None:
+        """
+        Reindex the records seeded or removed from outside the client since the last operation,
+        and continue new IDs after them.
+        """
+
+        seeded = self._records.seeded
+        if not seeded:
+            return
+
+        self._query_cache.clear()
+        for _id, replaced in seeded:
+            if replaced is not None:
+                self._unindex(_id, replaced)
+
+        seeded_ids = {_id for _id, _ in seeded}
+        seeded.clear()
+
+        records = self._records
+        for _id in seeded_ids:
+            if _id in records:
+                self._index(_id, records[_id])
+        self._ids = count(max(next(self._ids), max(seeded_ids) + 1))
+
+    def _normalize(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert the data to the shape records are stored and returned in.
+        Supabase returns iterables as strings, so the cache stores them as strings too.
+        Data without iterables is returned as is, without a copy.
+
+        Args:
+            data (Dict[str, Any]): The data to convert.
 
         Returns:
-            (Dict[str, Any]): The return data.
+            (Dict[str, Any]): The converted data.
+        """
+
+        if not any(isinstance(value, _STR_CONVERT_TYPES) for value in data.values()):
+            return data
+
+        return {key: str(value) if isinstance(value, _STR_CONVERT_TYPES) else value for key, value in data.items()}
+
+    def _index(self, _id: int, data: Dict[str, Any]) -> None:
+        """
+        Add the record ID to the indexes of the given columns.
+        Unhashable values can't be indexed and are skipped.
+
+        Args:
+            _id (int): The ID of the record.
+            data (Dict[str, Any]): The indexed columns of the record.
         """
-        result_data = copy(data)
 
+        indexes = self._indexes
         for key, value in data.items():
-            if type(value) in (list, tuple):
-                result_data.update({key: str(value)})
+            try:
+                indexes[key][value].add(_id)
+            except TypeError:
+                pass
 
-        return result_data
+    def _unindex(self, _id: int, data: Dict[str, Any]) -> None:
+        """
+        Remove the record ID from the indexes of the given columns.
+
+        Args:
+            _id (int): The ID of the record.
+            data (Dict[str, Any]): The indexed columns of the record.
+        """
+
+        indexes = self._indexes
+        for key, value in data.items():
+            try:
+                ids = indexes[key].get(value)
+            except TypeError:
+                continue
+
+            if ids is not None:
+                ids.discard(_id)
+                if not ids:
+                    del indexes[key][value]
+
+    def _update_record(self, _id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Update a cached record in place and move it between index buckets.
+
+        Args:
+            _id (int): The ID of the record.
+            data (Dict[str, Any]): The normalized data to update.
+
+        Returns:
+            (Dict[str, Any]): The updated record.
+        """
+
+        record = self._cache[_id]
+        if not data:
+            return record
+
+        self._query_cache.clear()
+
+        self._unindex(_id, {key: record[key] for key in data if key in record})
+        record |= data
+        self._index(_id, data)
+
+        return record
+
+    def _pop(self, _id: int) -> Dict[str, Any]:
+        """
+        Remove a record from the cache and the indexes.
+
+        Args:
+            _id (int): The ID of the record.
+
+        Returns:
+            (Dict[str, Any]): The removed record.
+        """
+
+        record = self._records.remove(_id)
+        self._query_cache.clear()
+        self._unindex(_id, record)
+        return record
+
+    def _lookup(self, *, eq: Dict[str, Any] | None = None, neq: Dict[str, Any] | None = None) -> Set[int]:
+        """
+        Look up the IDs of the records matching the filters in the indexes.
+        Raises TypeError if any filter value is unhashable.
+
+        Args:
+            eq (Dict[str, Any] | None): The equality filter.
+            neq (Dict[str, Any] | None): The non-equality filter.
+
+        Returns:
+            (Set[int]): The IDs of the matching records.
+        """
+
+        if eq:
+            ids = set.intersection(*(self._indexes.get(key, {}).get(value, set()) for key, value in eq.items()))
+        else:
+            ids = set(self._cache)
+
+        if neq:
+            for key, value in neq.items():
+                ids.difference_update(self._indexes.get(key, {}).get(value, ()))
+
+        return ids
+
+    def _filter_ids(self, *, eq: Dict[str, Any] | None = None, neq: Dict[str, Any] | None = None) -> List[int]:
+        """
+        Get the sorted IDs of the records matching the normalized filters.
+        Results are kept in an LRU query cache until the next write.
+        Raises TypeError if any filter value is unhashable.
+
+        Args:
+            eq (Dict[str, Any] | None): The equality filter.
+            neq (Dict[str, Any] | None): The non-equality filter.
+
+        Returns:
+            (List[int]): The IDs of the matching records.
+        """
+
+        key = (tuple(sorted(eq.items())) if eq else (), tuple(sorted(neq.items())) if neq else ())
+        ids = self._query_cache.get(key)
+
+        if ids is None:
+            ids = self._query_cache[key] = sorted(self._lookup(eq=eq, neq=neq))
+            if len(self._query_cache) > _QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+        else:
+            self._query_cache.move_to_end(key)
+
+        return ids
+
+    def _select_ids(self, *, eq: Dict[str, Any] | None = None, neq: Dict[str, Any] | None = None) -> List[int]:
+        """
+        Get the IDs of the records matching the filters.
+
+        Args:
+            eq (Dict[str, Any] | None): The equality filter.
+            neq (Dict[str, Any] | None): The non-equality filter.
+
+        Returns:
+            (List[int]): The IDs of the matching records.
+        """
+
+        try:
+            return self._filter_ids(eq=self._normalize(eq) if eq else eq, neq=self._normalize(neq) if neq else neq)
+        except TypeError:
+            # Unhashable filter values can't be looked up, take the IDs of the scanned records
+            return [record['id'] for record in self.select(eq=eq, neq=neq)]
 
     def insert(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Insert a new record into the table.
+        IDs are never reused after a delete, like a Postgres serial column.
 
         Args:
             data (Dict[str, Any]): The data to insert.
@@ -44,58 +328,154 @@ class CacheClient(BaseClient):
             (Dict[str, Any]): The inserted record
         """
 
-        # Get the next ID
-        if _ids := list(self._cache.keys()):
-            _id = _ids[-1] + 1
-        else:
-            _id = 1
+        self._sync()
+        _id = next(self._ids)
+
+        # The record is a new dict, so the caller can't change it behind the indexes' back
+        record = {**self._normalize(data), 'id': _id}
+
+        self._records.store(_id, record)
+        self._query_cache.clear()
+        self._index(_id, record)
+        return dict(record)
 
-        data['id'] = _id
+    def bulk_insert(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Bulk insert new records into the table.
+
+        Args:
+            data (List[Dict[str, Any]]): The data to insert.
+
+        Returns:
+            (List[Dict[str, Any]]): The inserted records.
+        """
 
-        self._cache[_id] = data
-        return self._get_return_data(self._cache[_id])
+        return [self.insert(record) for record in data]
 
-    def update(self, *, id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    def update(self, *, id: int, data: Dict[str, Any], returning: bool = True) -> Dict[str, Any] | None:
         """
         Update a record in the table.
 
         Args:
             id (int): The ID of the record to update.
+            returning (bool): Whether to return the updated record.
 
         Returns:
-            (Dict[str, Any]): The updated record.
+            (Dict[str, Any] | None): The updated record, or None if it's not returned.
         """
-        self._cache[id].update(data)
-        return self._get_return_data(self._cache[id])
 
-    def select(self, *, eq: Dict[str, Any] | None = None, neq: Dict[str, Any] | None = None) -> List[Dict[str, Any]]:
+        self._sync()
+        record = self._update_record(id, self._normalize(data))
+        return dict(record) if returning else None
+
+    def select(
+        self,
+        *,
+        eq: Dict[str, Any] | None = None,
+        neq: Dict[str, Any] | None = None,
+        limit: int | None = None,
+        columns: Iterable[str] | None = None,
+        order_by: str | None = None,
+    ) -> List[Dict[str, Any]]:
         """
         Select records from the table.
 
+        Args:
+            eq (Dict[str, Any] | None): The equality filter.
+            neq (Dict[str, Any] | None): The non-equality filter.
+            limit (int | None): The maximum number of records to select.
+            columns (Iterable[str] | None): The columns to select, all columns if None.
+            order_by (str | None): The column to order the records by, prefixed with '-' for descending order.
+
+        Returns:
+            (List[Dict[str, Any]]): The selected records.
+        """
+
+        self._sync()
+
+        if columns is not None:
+            # Records are stored whole, so the columns are picked from the selected ones
+            columns = tuple(columns)
+            records = self.select(eq=eq, neq=neq, limit=limit, order_by=order_by)
+            return [{column: record[column] for column in columns if column in record} for record in records]
+
+        if order_by is not None:
+            # Records are selected in ID order, so the matching ones are sorted before the limit is applied
+            column = order_by.removeprefix('-')
+            records = sorted(self.select(eq=eq, neq=neq), key=itemgetter(column), reverse=column != order_by)
+            return records[:limit] if limit is not None else records
+
+        # Filter values are compared against records in their stored shape
+        eq = self._normalize(eq) if eq else eq
+        neq = self._normalize(neq) if neq else neq
+
+        try:
+            ids = self._filter_ids(eq=eq, neq=neq)
+        except TypeError:
+            # Unhashable filter values can't be looked up, fall back to a full scan
+            pass
+        else:
+            cache = self._cache
+            return [dict(cache[_id]) for _id in ids[:limit]]
+
+        records = self._cache.values()
+
+        if eq:
+            # itemgetter returns the values in the same shape for the filter and for a record,
+            # so all equality columns are compared at once
+            get_eq = itemgetter(*eq)
+            eq_values = get_eq(eq)
+            records = [obj for obj in records if get_eq(obj) == eq_values]
+
+        # Each non-equality column narrows the records down, so rejected records aren't checked again
+        for key, value in neq.items() if neq else ():
+            records = [obj for obj in records if obj[key] != value]
+
+        return [dict(record) for record in (records[:limit] if limit is not None else records)]  # pyright: ignore
+
+    def count(self, *, eq: Dict[str, Any] | None = None, neq: Dict[str, Any] | None = None) -> int:
+        """
+        Count records in the table.
+
         Args:
             eq (Dict[str, Any] | None): The equality filter.
             neq (Dict[str, Any] | None): The non-equality filter.
 
+        Returns:
+            (int): The number of matching records.
+        """
+
+        self._sync()
+        return len(self._select_ids(eq=eq, neq=neq))
+
+    def select_in(self, *, column: str, values: Iterable[Any]) -> List[Dict[str, Any]]:
+        """
+        Select records whose column value is one of the given values.
+
+        Args:
+            column (str): The column to filter by.
+            values (Iterable[Any]): The accepted column values.
+
         Returns:
             (List[Dict[str, Any]]): The selected records.
         """
 
-        def _filter(obj: Dict[str, Any]) -> bool:
-            """Filter the records based on the equality and non-equality filters."""
-            _eq = eq if eq else {}
-            _neq = neq if neq else {}
+        self._sync()
+        cache = self._cache
 
-            for key, value in _eq.items():
-                if not obj[key] == value:
-                    return False
+        if column == 'id':
+            return [dict(cache[_id]) for _id in values if _id in cache]
 
-            for key, value in _neq.items():
-                if not obj[key] != value:
-                    return False
+        values = list(values)
+        index = self._indexes.get(column, {})
 
-            return True
+        try:
+            ids = set().union(*(index.get(value, ()) for value in values))
+        except TypeError:
+            # Unhashable values can't be looked up, fall back to a full scan
+            return [dict(record) for record in cache.values() if record.get(column) in values]
 
-        return list(filter(_filter, self._cache.values()))
+        return [dict(cache[_id]) for _id in sorted(ids)]
 
     def delete(self, *, id: int) -> None:
         """
@@ -105,7 +485,8 @@ class CacheClient(BaseClient):
             id (int): The ID of the record to delete.
         """
 
-        del self._cache[id]
+        self._sync()
+        self._pop(id)
 
     def bulk_update(self, *, ids: Iterable[int], data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -119,13 +500,90 @@ class CacheClient(BaseClient):
             (List[str, Any]): The updated records.
         """
 
+        self._sync()
+
+        # The data is the same for every record, so it's normalized only once
+        data = self._normalize(data)
+        update_record = self._update_record
+        return [dict(update_record(_id, data)) for _id in ids]
+
+    def update_where(
+        self,
+        *,
+        data: Dict[str, Any],
+        eq: Dict[str, Any] | None = None,
+        neq: Dict[str, Any] | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Update the records matching the filters.
+
+        Args:
+            data (Dict[str, Any]): The data to update.
+            eq (Dict[str, Any] | None): The equality filter.
+            neq (Dict[str, Any] | None): The non-equality filter.
+
+        Returns:
+            (List[Dict[str, Any]]): The updated records.
+        """
+
+        self._sync()
+        return self.bulk_update(ids=self._select_ids(eq=eq, neq=neq), data=data)
+
+    def bulk_upsert(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Bulk insert or update records with IDs, each with its own data.
+        Like a PostgREST upsert, every column of the batch is written to every record, as None where it's missing.
+
+        Args:
+            data (List[Dict[str, Any]]): The records to save, including their IDs.
+
+        Returns:
+            (List[Dict[str, Any]]): The saved records.
+        """
+
+        self._sync()
+        cache = self._cache
         result = []
-        for _id in ids:
-            self._cache[_id].update(data)
-            result.append(self._cache[_id])
+        columns = dict.fromkeys(key for record in data for key in record)
+
+        for record in data:
+            _id = record['id']
+            record = self._normalize({column: record.get(column) for column in columns})
+
+            if _id in cache:
+                result.append(dict(self._update_record(_id, record)))
+                continue
+
+            # Like an explicit ID in Postgres, but new IDs also continue after it
+            self._ids = count(max(next(self._ids), _id + 1))
+            record = dict(record)
+            self._records.store(_id, record)
+            self._query_cache.clear()
+            self._index(_id, record)
+            result.append(dict(record))
 
         return result
 
+    def delete_where(
+        self,
+        *,
+        eq: Dict[str, Any] | None = None,
+        neq: Dict[str, Any] | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Delete the records matching the filters.
+
+        Args:
+            eq (Dict[str, Any] | None): The equality filter.
+            neq (Dict[str, Any] | None): The non-equality filter.
+
+        Returns:
+            (List[Dict[str, Any]]): The deleted records.
+        """
+
+        self._sync()
+        return self.bulk_delete(ids=self._select_ids(eq=eq, neq=neq))
+
     def bulk_delete(self, *, ids: Iterable[int]) -> List[Dict[str, Any]]:
         """
         Bulk delete records in the table.
@@ -137,8 +595,6 @@ class CacheClient(BaseClient):
             (List[Dict[str, Any]]): The deleted records.
         """
 
-        result = []
-        for _id in ids:
-            result.append(self._cache[_id])
-            del self._cache[_id]
-        return result
+        self._sync()
+        pop = self._pop
+        return [pop(_id) for _id in ids]
@@ -1,26 +1,90 @@
 import os
-from typing import Any, Dict, Iterable, List
-
-from supabase.client import create_client
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Tuple
 
 from .base import BaseClient
 
 
+if TYPE_CHECKING:
+    from supabase.client import Client
+
+
+# The Supabase SDK is heavy to import, so it's imported when the first client is created
+create_client: Callable[[str, str], 'Client'] | None = None
+
+# Supabase clients shared by all tables, keyed by (url, key)
+_supabase_clients: Dict[Tuple[str, str], 'Client'] = {}
+_supabase_clients_lock = Lock()
+
+
+def _get_supabase_client(url: str, key: str) -> 'Client':
+    """
+    Get the Supabase client for the given credentials.
+    The client is created on first use and shared afterwards, so its HTTP session is reused.
+    Creation is locked, so clients created from several threads at once still share one.
+
+    Args:
+        url (str): The Supabase URL.
+        key (str): The Supabase key.
+
+    Returns:
+        (Client): The Supabase client.
+    """
+
+    global create_client
+
+    supabase_client = _supabase_clients.get((url, key))
+    if supabase_client is None:
+        with _supabase_clients_lock:
+            supabase_client = _supabase_clients.get((url, key))
+            if supabase_client is None:
+                if create_client is None:
+                    from supabase.client import create_client
+                supabase_client = _supabase_clients[(url, key)] = create_client(url, key)
+    return supabase_client
+
+
 class SupabaseClient(BaseClient):
     """Client for Supabase."""
 
+    __slots__ = ('query',)
+
     def __init__(self, table_name: str):
         """
         Initialize the client with the table name.
-        It creates a Supabase client and a query object.
+        It gets the shared Supabase client and creates a query object.
         """
 
         super().__init__(table_name=table_name)
         url: str = os.getenv('SUPABASE_URL') or ''
         key: str = os.getenv('SUPABASE_KEY') or ''
-        supabase_client = create_client(url, key)
+        supabase_client = _get_supabase_client(url, key)
         self.query = supabase_client.table(table_name=self.table_name)
 
+    @staticmethod
+    def _filter(_query: Any, *, eq: Dict[str, Any] | None = None, neq: Dict[str, Any] | None = None) -> Any:
+        """
+        Apply the equality and non-equality filters to a query.
+
+        Args:
+            _query (Any): The PostgREST query builder.
+            eq (Dict[str, Any] | None): The equality filter.
+            neq (Dict[str, Any] | None): The non-equality filter.
+
+        Returns:
+            (Any): The filtered query builder.
+        """
+
+        if eq:
+            # All equality filters are applied in a single call
+            _query = _query.match(eq)
+
+        if neq:
+            for column, value in neq.items():
+                _query = _query.neq(column, value)
+
+        return _query
+
     def insert(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Insert a new record into the table.
@@ -35,42 +99,122 @@ class SupabaseClient(BaseClient):
         response = self.query.insert(data).execute()
         return response.data[0]
 
-    def update(self, *, id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    def bulk_insert(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Bulk insert new records into the table in a single request.
+
+        Args:
+            data (List[Dict[str, Any]]): The data to insert.
+
+        Returns:
+            (List[Dict[str, Any]]): List of inserted records.
+        """
+
+        response = self.query.insert(data).execute()
+        return response.data
+
+    def update(self, *, id: int, data: Dict[str, Any], returning: bool = True) -> Dict[str, Any] | None:
         """
         Update a record in the table.
+        If the record isn't returned, PostgREST doesn't send it back in the response.
 
         Args:
             id (int): The ID of the record to update.
             data (Dict[str, Any]): The data to update.
+            returning (bool): Whether to return the updated record.
 
         Returns:
-            (Dict[str, Any]): The updated record.
+            (Dict[str, Any] | None): The updated record, or None if it's not returned.
         """
 
+        if not returning:
+            self.query.update(data, returning='minimal').eq('id', id).execute()  # pyright: ignore
+            return None
+
         response = self.query.update(data).eq('id', id).execute()
         return response.data[0]
 
-    def select(self, *, eq: Dict[str, Any] | None = None, neq: Dict[str, Any] | None = None) -> List[Dict[str, Any]]:
+    def select(
+        self,
+        *,
+        eq: Dict[str, Any] | None = None,
+        neq: Dict[str, Any] | None = None,
+        limit: int | None = None,
+        columns: Iterable[str] | None = None,
+        order_by: str | None = None,
+    ) -> List[Dict[str, Any]]:
         """
         Select records from the table.
 
         Args:
             eq (Dict[str, Any] | None): The equality filter.
             neq (Dict[str, Any] | None): The non-equality filter.
+            limit (int | None): The maximum number of records to select.
+            columns (Iterable[str] | None): The columns to select, all columns if None.
+            order_by (str | None): The column to order the records by, prefixed with '-' for descending order.
 
         Returns:
             (List[Dict[str, Any]]): The selected records.
         """
 
-        _query = self.query.select('*')
+        _query = self.query.select(*(columns or ('*',)))
 
-        if eq:
-            for eq_filter in list(eq.items()):
-                _query = _query.eq(*eq_filter)
+        _query = self._filter(_query, eq=eq, neq=neq)
 
-        if neq:
-            for neq_filter in list(neq.items()):
-                _query = _query.neq(*neq_filter)
+        if order_by is not None:
+            column = order_by.removeprefix('-')
+            _query = _query.order(column, desc=column != order_by)
+
+        if limit is not None:
+            _query = _query.limit(limit)
+
+        response = _query.execute()
+        return response.data
+
+    def count(self, *, eq: Dict[str, Any] | None = None, neq: Dict[str, Any] | None = None) -> int:
+        """
+        Count records in the table.
+        The count is computed by the database and no records are sent back.
+
+        Args:
+            eq (Dict[str, Any] | None): The equality filter.
+            neq (Dict[str, Any] | None): The non-equality filter.
+
+        Returns:
+            (int): The number of matching records.
+        """
+
+        _query = self.query.select('id', count='exact', head=True)  # pyright: ignore
+
+        _query = self._filter(_query, eq=eq, neq=neq)
+
+        response = _query.execute()
+        return response.count or 0
+
+    def select_in(self, *, column: str, values: Iterable[Any]) -> List[Dict[str, Any]]:
+        """
+        Select records whose column value is one of the given values in a single request.
+        No request is made for no values, and a single value is filtered by plain equality.
+
+        Args:
+            column (str): The column to filter by.
+            values (Iterable[Any]): The accepted column values.
+
+        Returns:
+            (List[Dict[str, Any]]): The selected records.
+        """
+
+        values = list(values)
+
+        if not values:
+            return []
+
+        _query = self.query.select('*')
+
+        if len(values) == 1:
+            _query = _query.eq(column, values[0])
+        else:
+            _query = _query.in_(column, values)
 
         response = _query.execute()
         return response.data
@@ -100,6 +244,62 @@ class SupabaseClient(BaseClient):
         response = self.query.update(data).in_('id', ids).execute()
         return response.data
 
+    def update_where(
+        self,
+        *,
+        data: Dict[str, Any],
+        eq: Dict[str, Any] | None = None,
+        neq: Dict[str, Any] | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Update the records matching the filters in a single request.
+
+        Args:
+            data (Dict[str, Any]): The data to update.
+            eq (Dict[str, Any] | None): The equality filter.
+            neq (Dict[str, Any] | None): The non-equality filter.
+
+        Returns:
+            (List[Dict[str, Any]]): List of updated records.
+        """
+
+        response = self._filter(self.query.update(data), eq=eq, neq=neq).execute()
+        return response.data
+
+    def bulk_upsert(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Bulk insert or update records with IDs, each with its own data, in a single request.
+
+        Args:
+            data (List[Dict[str, Any]]): The records to save, including their IDs.
+
+        Returns:
+            (List[Dict[str, Any]]): List of saved records.
+        """
+
+        response = self.query.upsert(data).execute()
+        return response.data
+
+    def delete_where(
+        self,
+        *,
+        eq: Dict[str, Any] | None = None,
+        neq: Dict[str, Any] | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Delete the records matching the filters in a single request.
+
+        Args:
+            eq (Dict[str, Any] | None): The equality filter.
+            neq (Dict[str, Any] | None): The non-equality filter.
+
+        Returns:
+            (List[Dict[str, Any]]): List of deleted records.
+        """
+
+        response = self._filter(self.query.delete(), eq=eq, neq=neq).execute()
+        return response.data
+
     def bulk_delete(self, *, ids: Iterable[int]) -> List[Dict[str, Any]]:
         """
         Bulk delete records from the table.
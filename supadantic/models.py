@@ -1,10 +1,13 @@
 import ast
+import asyncio
+import json
 import re
 from abc import ABC
 from copy import copy
-from typing import Any, Dict, Type
+from types import UnionType
+from typing import Any, ClassVar, Dict, List, Type, Union, get_args, get_origin
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, TypeAdapter, create_model, field_validator, model_validator
 from pydantic._internal._model_construction import ModelMetaclass as PydanticModelMetaclass
 from typing_extensions import Self
 
@@ -13,25 +16,181 @@ from .clients.base import BaseClient
 from .q_set import QSet
 
 
+# Types that Supabase returns as is, without any coercion needed
+_TRUSTED_TYPES = (int, str, bool, type(None))
+
+# Types that Supabase returns as strings
+_ARRAY_TYPES = (list, tuple, set, frozenset)
+
+# Fields that are never sent on save, the ID is set by the database
+_SAVE_EXCLUDE = frozenset({'id'})
+
+# Model config keys that don't change how trusted records are validated, any other key requires validation
+_TRUSTED_CONFIG_KEYS = frozenset(
+    {
+        'title',
+        'model_title_generator',
+        'field_title_generator',
+        'use_attribute_docstrings',
+        'json_schema_extra',
+        'json_schema_mode_override',
+        'json_schema_serialization_defaults_required',
+        'json_encoders',
+        'ser_json_bytes',
+        'ser_json_inf_nan',
+        'ser_json_temporal',
+        'ser_json_timedelta',
+        'serialize_by_alias',
+        'frozen',
+        'validate_assignment',
+        'revalidate_instances',
+        'validate_return',
+        'from_attributes',
+        'arbitrary_types_allowed',
+        'ignored_types',
+        'protected_namespaces',
+        'populate_by_name',
+        'validate_by_name',
+        'validate_by_alias',
+        'loc_by_alias',
+        'hide_input_in_errors',
+        'validation_error_cause',
+        'cache_strings',
+        'defer_build',
+        'plugin_settings',
+        'schema_generator',
+        'extra',
+    }
+)
+
+# Positions before capital letters, except the first one
+_SNAKE_CASE_RE = re.compile(r'(?<!^)(?=[A-Z])')
+
+
 def _to_snake_case(value: str) -> str:
-    return re.sub(r'(?<!^)(?=[A-Z])', '_', value).lower()
+    return _SNAKE_CASE_RE.sub('_', value).lower()
+
+
+def _decode_array(value: str) -> Any:
+    # JSON arrays are parsed by the C decoder, Python literals like tuples fall back to literal_eval
+    try:
+        return json.loads(value)
+    except ValueError:
+        return ast.literal_eval(value)
+
+
+def _is_trusted_annotation(annotation: Any) -> bool:
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        return all(_is_trusted_annotation(arg) for arg in get_args(annotation))
+    if origin in (list, tuple):
+        # Arrays of scalars only need decoding, which BaseSBModel._from_db does itself
+        return all(arg is Ellipsis or arg in _TRUSTED_TYPES for arg in get_args(annotation))
+    return annotation in _TRUSTED_TYPES
+
+
+def _is_array_annotation(annotation: Any, array_types: tuple = _ARRAY_TYPES) -> bool:
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        return any(_is_array_annotation(arg, array_types) for arg in get_args(annotation))
+    return (origin or annotation) in array_types
+
+
+def _is_plain_annotation(annotation: Any) -> bool:
+    if get_origin(annotation) in (Union, UnionType, list, tuple):
+        return all(arg is Ellipsis or _is_plain_annotation(arg) for arg in get_args(annotation))
+    return annotation in _TRUSTED_TYPES
+
+
+def _has_plain_dump(model: Type[BaseModel]) -> bool:
+    """
+    Check whether the model dump of the model is just its field values.
+    It's true if all fields are scalars or sequences of scalars,
+    and nothing customizes the serialization.
+    """
+
+    decorators = model.__pydantic_decorators__
+
+    return all(
+        (
+            model.__pydantic_complete__,
+            model.model_config.get('extra') != 'allow',
+            not model.model_computed_fields,
+            not decorators.field_serializers,
+            not decorators.model_serializers,
+            all(
+                _is_plain_annotation(field.annotation) and not field.metadata and not field.exclude
+                for field in model.model_fields.values()
+            ),
+        )
+    )
+
+
+def _has_trusted_rows(model: Type[BaseModel]) -> bool:
+    """
+    Check whether the database records of the model can skip validation.
+    It's possible only if validation can't change the data beyond decoding arrays:
+    all fields are plain scalars or arrays of them without aliases or custom validators,
+    and the model config has no options like strict or str_strip_whitespace that change validation.
+    """
+
+    decorators = model.__pydantic_decorators__
+
+    return all(
+        (
+            model.__pydantic_complete__,
+            model.model_config.keys() <= _TRUSTED_CONFIG_KEYS,
+            model.model_config.get('extra') in (None, 'ignore'),
+            not decorators.field_validators,
+            not decorators.validators,
+            set(decorators.model_validators) <= {'_validate_data_from_supabase'},
+            all(
+                _is_trusted_annotation(field.annotation) and not field.metadata and field.alias is None
+                for field in model.model_fields.values()
+            ),
+        )
+    )
 
 
 class ModelMetaclass(PydanticModelMetaclass):
     def __new__(mcs, name: str, bases: Any, namespace: dict, *args, **kwargs) -> type:
         """
-        Create a new model class with a QSet instance.
+        Create a new model class with precomputed database metadata.
         """
         new_model = super().__new__(mcs, name, bases, namespace, *args, **kwargs)
-        new_model.objects = QSet(new_model)
+        new_model._trusted_rows = new_model.trust_db_rows and _has_trusted_rows(new_model)
+        new_model._plain_dump = _has_plain_dump(new_model)
+        new_model._field_names = frozenset(new_model.model_fields)
+        new_model._save_fields = tuple(field for field in new_model.model_fields if field != 'id')
+        new_model._array_fields = frozenset(
+            name for name, field in new_model.model_fields.items() if _is_array_annotation(field.annotation)
+        )
+        new_model._tuple_fields = frozenset(
+            name for name, field in new_model.model_fields.items() if _is_array_annotation(field.annotation, (tuple,))
+        )
         return new_model
 
 
+class _QSetDescriptor:
+    """
+    Descriptor for the QSet of a model, available on the model class and its instances.
+    A new QSet is created on every access, so lookups never share state and class creation doesn't build one.
+    """
+
+    def __get__(self, obj: Any, owner: Type['BaseSBModel']) -> QSet:
+        return QSet(owner)
+
+
 class BaseSBModel(BaseModel, ABC, metaclass=ModelMetaclass):
     """Base model for Supabase tables."""
 
     id: int | None = None
 
+    # Whether database records of plain models skip validation, set to False to always validate them
+    trust_db_rows: ClassVar[bool] = True
+
+    objects: ClassVar[QSet] = _QSetDescriptor()  # pyright: ignore
+
     class DoesNotExist(Exception):
         pass
 
@@ -42,24 +201,212 @@ class BaseSBModel(BaseModel, ABC, metaclass=ModelMetaclass):
     def _get_table_name(cls) -> str:
         """
         Get the table name from the class name.
-        Method converts the class name to snake case.
+        Method converts the class name to snake case once and caches it on the class.
 
         Returns:
             (str): The table name in snake case.
         """
-        return _to_snake_case(cls.__name__)
+
+        # Look up the class' own namespace, so subclasses don't reuse the parent's table name
+        table_name = cls.__dict__.get('_table_name')
+        if table_name is None:
+            table_name = cls._table_name = _to_snake_case(cls.__name__)  # pyright: ignore
+        return table_name
 
     @classmethod
     def _get_db_client(cls) -> BaseClient:
         """
         Get the database client for the model.
+        The client is created on first use and cached on the model class.
 
         Returns:
             (BaseClient): The database client.
         """
 
-        table_name = cls._get_table_name()
-        return cls.db_client()(table_name)
+        # Look up the class' own namespace, so subclasses don't reuse the parent's client
+        db_client = cls.__dict__.get('_db_client_instance')
+        if db_client is None:
+            table_name = cls._get_table_name()
+            db_client = cls._db_client_instance = cls.db_client()(table_name)  # pyright: ignore
+        return db_client
+
+    @classmethod
+    def _from_db(cls, data: Dict[str, Any]) -> Self:
+        """
+        Create a model instance from a record returned by the database client.
+        Records of models with plain scalar or array fields are trusted and skip validation,
+        only their arrays are decoded. Models with trust_db_rows set to False always validate them.
+
+        Args:
+            data (Dict[str, Any]): The record.
+
+        Returns:
+            (Self): The model instance.
+        """
+
+        if not cls._trusted_rows:  # pyright: ignore
+            return cls(**data)
+
+        return cls._construct(data)
+
+    @classmethod
+    def _construct(cls, data: Dict[str, Any]) -> Self:
+        """
+        Create a model instance from a record without validation.
+        Only the arrays are decoded, and the fields missing from the record get their defaults.
+
+        Args:
+            data (Dict[str, Any]): The record.
+
+        Returns:
+            (Self): The model instance.
+        """
+
+        data = cls._decode_arrays(data)
+
+        # Decoded arrays are lists, but model_construct doesn't convert them to tuples
+        tuple_fields = cls._tuple_fields & data.keys()  # pyright: ignore
+        tuple_fields = [key for key in tuple_fields if isinstance(data[key], list)]
+        if tuple_fields:
+            data = {**data, **{key: tuple(data[key]) for key in tuple_fields}}
+
+        return cls.model_construct(**data)
+
+    @classmethod
+    def _from_db_partial(cls, data: Dict[str, Any]) -> Self:
+        """
+        Create a model instance from a record with only some columns selected.
+        The fields that weren't selected are left unset, so reading them raises an AttributeError and they aren't saved.
+        Untrusted records are validated by _partial_model, since the missing fields would fail a full validation.
+
+        Args:
+            data (Dict[str, Any]): The partial record.
+
+        Returns:
+            (Self): The model instance.
+        """
+
+        if cls._trusted_rows:  # pyright: ignore
+            instance = cls._construct(data)
+            selected = data.keys()
+        else:
+            # The model validators of the partial model are dropped, so the arrays are decoded first
+            validated = cls._partial_model().model_validate(cls._decode_arrays(data))
+            selected = validated.model_fields_set
+            instance = cls.model_construct(**{field: getattr(validated, field) for field in selected})
+
+        # model_construct fills the missing fields with their defaults, which would be saved over the stored values
+        values = instance.__dict__
+        for field in cls._field_names - selected:  # pyright: ignore
+            values.pop(field, None)
+
+        return instance
+
+    @classmethod
+    def _partial_model(cls) -> Type[BaseModel]:
+        """
+        Get a model validating only the fields present in the data, for records with only some columns selected.
+        It has the fields, config and field validators of the model, but all fields are optional
+        and the model validators are dropped, since they may read the fields that weren't selected.
+
+        Returns:
+            (Type[BaseModel]): The partial model.
+        """
+
+        # Look up the class' own namespace, so subclasses don't reuse the parent's model
+        partial_model = cls.__dict__.get('_partial_model_class')
+        if partial_model is not None:
+            return partial_model
+
+        fields = {}
+        for name, field in cls.model_fields.items():
+            field = copy(field)
+            field.default, field.default_factory = None, None
+            fields[name] = (field.annotation, field)
+
+        validators = {
+            name: field_validator(*decorator.info.fields, mode=decorator.info.mode, check_fields=False)(
+                getattr(decorator.func, '__func__', decorator.func)
+            )
+            for name, decorator in cls.__pydantic_decorators__.field_validators.items()
+        }
+
+        partial_model = create_model(  # pyright: ignore
+            f'{cls.__name__}Partial',
+            __config__=cls.model_config,
+            __validators__=validators,
+            **fields,
+        )
+        cls._partial_model_class = partial_model  # pyright: ignore
+        return partial_model
+
+    @classmethod
+    def _from_db_many(cls, data: List[Dict[str, Any]], *, partial: bool = False) -> List[Self]:
+        """
+        Create model instances from records returned by the database client.
+        Untrusted records are validated as a whole list in a single pydantic call.
+        Partial records would fail validation on their missing fields, so they are built by _from_db_partial.
+
+        Args:
+            data (List[Dict[str, Any]]): The records.
+            partial (bool): Whether only some columns of the records were selected.
+
+        Returns:
+            (List[Self]): The model instances.
+        """
+
+        if partial:
+            from_db_partial = cls._from_db_partial
+            return [from_db_partial(record) for record in data]
+
+        if cls._trusted_rows:  # pyright: ignore
+            from_db = cls._from_db
+            return [from_db(record) for record in data]
+
+        # Look up the class' own namespace, so subclasses don't reuse the parent's adapter
+        list_adapter = cls.__dict__.get('_list_adapter')
+        if list_adapter is None:
+            list_adapter = cls._list_adapter = TypeAdapter(List[cls])  # pyright: ignore
+        return list_adapter.validate_python(data)
+
+    @classmethod
+    def _decode_arrays(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Decode the array fields that Supabase returned as strings.
+        The data is copied only if there is something to decode.
+
+        Args:
+            data (Dict[str, Any]): The record.
+
+        Returns:
+            (Dict[str, Any]): The record with decoded arrays.
+        """
+
+        array_fields = cls._array_fields & data.keys()  # pyright: ignore
+        string_arrays = [key for key in array_fields if isinstance(data[key], str)]
+        if not string_arrays:
+            return data
+
+        result_dict = copy(data)
+        for key in string_arrays:
+            result_dict[key] = _decode_array(data[key])
+
+        return result_dict
+
+    def _get_save_data(self) -> Dict[str, Any]:
+        """
+        Get the data to save to the database, i.e. the model dump without the ID.
+        Plain models skip the pydantic serializer and read the field values directly.
+        Fields left unset by a partial select aren't in the instance, so they aren't saved.
+
+        Returns:
+            (Dict[str, Any]): The data to save.
+        """
+
+        if self._plain_dump:  # pyright: ignore
+            values = self.__dict__
+            return {field: values[field] for field in self._save_fields if field in values}  # pyright: ignore
+        return self.model_dump(exclude=_SAVE_EXCLUDE)
 
     @classmethod
     def db_client(cls) -> Type[BaseClient]:
@@ -72,25 +419,33 @@ class BaseSBModel(BaseModel, ABC, metaclass=ModelMetaclass):
         """
         return SupabaseClient
 
-    def save(self: Self) -> Self:
+    def save(self: Self, *, refresh: bool = True) -> Self:
         """
         Save the model instance to the database.
         If the instance has an ID, it will be updated.
         Otherwise, it will be inserted.
 
+        Args:
+            refresh (bool): Whether to build the result from the updated record.
+                If False, an update doesn't send the record back and the instance itself is returned.
+                Inserts always return the record, since its ID is set by the database.
+
         Returns:
             (Self): The saved model instance.
         """
 
         db_client = self._get_db_client()
-        data = self.model_dump(exclude={'id'})
+        data = self._get_save_data()
 
-        if self.id:
+        if not self.id:
+            response_data = db_client.insert(data)
+        elif refresh:
             response_data = db_client.update(id=self.id, data=data)
         else:
-            response_data = db_client.insert(data)
+            db_client.update(id=self.id, data=data, returning=False)
+            return self
 
-        return self.__class__(**response_data)
+        return self._from_db(response_data)  # pyright: ignore
 
     def delete(self: Self) -> None:
         """
@@ -102,6 +457,31 @@ class BaseSBModel(BaseModel, ABC, metaclass=ModelMetaclass):
             db_client = self._get_db_client()
             db_client.delete(id=self.id)
 
+    async def asave(self: Self, *, refresh: bool = True) -> Self:
+        """
+        Save the model instance to the database without blocking the event loop.
+        The request runs in a worker thread, so several saves can run concurrently.
+
+        Args:
+            refresh (bool): Whether to build the result from the updated record.
+
+        Returns:
+            (Self): The saved model instance.
+
+        Examples:
+            >>> first, second = await asyncio.gather(first.asave(), second.asave())
+        """
+
+        return await asyncio.to_thread(self.save, refresh=refresh)
+
+    async def adelete(self: Self) -> None:
+        """
+        Delete the model instance from the database without blocking the event loop.
+        The request runs in a worker thread, so several deletes can run concurrently.
+        """
+
+        await asyncio.to_thread(self.delete)
+
     @model_validator(mode='before')
     def _validate_data_from_supabase(cls, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -115,24 +495,4 @@ class BaseSBModel(BaseModel, ABC, metaclass=ModelMetaclass):
             (Dict[str, Any]): The validated data.
         """
 
-        array_fields = []
-        result_dict = copy(data)
-
-        for key, value in cls.model_json_schema()['properties'].items():
-            _field_is_array = any(
-                (
-                    # If field is required, it's possible to get type
-                    value.get('type', None) == 'array',
-                    # If field is optional, it's possible to get type from anyOf array
-                    any(item.get('type', None) == 'array' for item in value.get('anyOf', [])),
-                )
-            )
-
-            if _field_is_array:
-                array_fields.append(key)
-
-        for key, value in data.items():
-            if key in array_fields and isinstance(value, str):
-                result_dict[key] = ast.literal_eval(value)
-
-        return result_dict
+        return cls._decode_arrays(data)
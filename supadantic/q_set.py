@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Any, Dict, List, NoReturn, Type
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, NoReturn, Tuple, Type
 
 from typing_extensions import Self
 
@@ -11,39 +12,145 @@ if TYPE_CHECKING:
 class QSet:
     """Lazy database lookup for a set of objects."""
 
+    __slots__ = ('_model_class', '_objects', '_client', '_eq', '_neq', '_fields', '_detached')
+
     class InvalidFilter(Exception):
         pass
 
     class InvalidField(Exception):
         pass
 
-    def __init__(self, model_class: Type['BaseSBModel'], objects: List['BaseSBModel'] | None = None) -> None:
+    def __init__(
+        self,
+        model_class: Type['BaseSBModel'],
+        objects: List['BaseSBModel'] | None = None,
+        eq: Dict[str, Any] | None = None,
+        neq: Dict[str, Any] | None = None,
+        fields: Tuple[str, ...] | None = None,
+        detached: bool = False,
+    ) -> None:
         """
         Initialize the QSet with the model class and objects.
 
         Args:
             model_class (Type[BaseSBModel]): The model class.
-            objects (List[BaseSBModel] | None): The objects to initialize the QSet with.
+            objects (List[BaseSBModel] | None): The objects to initialize the QSet with, None if not loaded.
+            eq (Dict[str, Any] | None): The equality filter the objects are selected with.
+            neq (Dict[str, Any] | None): The non-equality filter the objects are selected with.
+            fields (Tuple[str, ...] | None): The only fields the objects are selected with, all fields if None.
+            detached (bool): Whether the objects were filtered in Python, so the filters no longer describe them.
         """
 
         self._model_class = model_class
-        self.objects = objects if objects else []
+        self._objects = objects
+        self._client: 'BaseClient | None' = None
+        self._eq = eq
+        self._neq = neq
+        self._fields = fields
+        self._detached = detached
+
+    @property
+    def objects(self) -> List['BaseSBModel']:
+        """
+        Get the objects in the QSet.
+        They are selected with the QSet's filters on first access.
+
+        Returns:
+            (List[BaseSBModel]): The objects.
+        """
+
+        return self._fetch()._objects  # pyright: ignore
+
+    @objects.setter
+    def objects(self, objects: List['BaseSBModel']) -> None:
+        self._objects = objects
 
     @property
     def client(self) -> 'BaseClient':
         """
         Get the database client for the model.
+        It's looked up on first use and kept for the QSet's lifetime.
 
         Returns:
             (BaseClient): The database client.
         """
 
-        return self._model_class._get_db_client()
+        if self._client is None:
+            self._client = self._model_class._get_db_client()
+        return self._client
+
+    def bulk_create(self, objs: Iterable['BaseSBModel']) -> List['BaseSBModel']:
+        """
+        Insert the objects into the database in a single request.
+
+        Args:
+            objs (Iterable[BaseSBModel]): The objects to insert.
+
+        Returns:
+            (List[BaseSBModel]): The inserted objects.
+
+        Examples:
+            >>> objs = Model.objects.bulk_create([Model(name='first'), Model(name='second')])
+        """
+
+        data = [obj._get_save_data() for obj in objs]
+        if not data:
+            return []
+
+        response_data = self.client.bulk_insert(data)
+        return self._model_class._from_db_many(response_data)
+
+    def bulk_save(self, objs: Iterable['BaseSBModel']) -> List['BaseSBModel']:
+        """
+        Save the objects to the database in at most two requests.
+        New objects are inserted, and objects with an ID are updated with their own data.
+        An upsert writes every column of the batch, so objects with only some fields selected
+        are updated one by one instead, without overwriting the fields they don't have.
+
+        Args:
+            objs (Iterable[BaseSBModel]): The objects to save.
+
+        Returns:
+            (List[BaseSBModel]): The saved objects, in the order they were passed.
+
+        Examples:
+            >>> objs = Model.objects.bulk_save([Model(name='new'), Model(id=1, name='updated')])
+        """
+
+        objs = list(objs)
+        field_names = self._model_class._field_names  # pyright: ignore
+        new_positions, saved_positions, partial_positions = [], [], []
+        for position, obj in enumerate(objs):
+            if not obj.id:
+                new_positions.append(position)
+            elif obj.__dict__.keys() >= field_names:
+                saved_positions.append(position)
+            else:
+                partial_positions.append(position)
+
+        result: List['BaseSBModel'] = [None] * len(objs)  # pyright: ignore
+        for position, obj in zip(new_positions, self.bulk_create(objs[position] for position in new_positions)):
+            result[position] = obj
+
+        data = [{'id': objs[position].id, **objs[position]._get_save_data()} for position in saved_positions]
+        if data:
+            response_data = self.client.bulk_upsert(data)
+            saved = {obj.id: obj for obj in self._model_class._from_db_many(response_data)}
+            for position in saved_positions:
+                result[position] = saved[objs[position].id]
+
+        for position in partial_positions:
+            obj = objs[position]
+            response_data = self.client.update(id=obj.id, data=obj._get_save_data())  # pyright: ignore
+            result[position] = self._model_class._from_db(response_data)  # pyright: ignore
+
+        return result
 
     def update(self, **data) -> int | NoReturn:
         """
         Update the objects in the QSet with the data.
         If data is not valid, raise an InvalidField exception.
+        A QSet that isn't loaded yet is updated by its filters in a single request, without selecting the objects.
 
         Returns:
             (int): The number of objects updated.
@@ -55,17 +162,25 @@ class QSet:
             >>> qs = Model.objects.update(name='new_name')
         """
 
-        for field in data.keys():
-            if field not in self._model_class.model_fields.keys():
-                raise self.InvalidField(f'Invalid field {field}!')
+        invalid_fields = data.keys() - self._model_class._field_names  # pyright: ignore
+        if invalid_fields:
+            raise self.InvalidField(f'Invalid field {", ".join(sorted(invalid_fields))}!')
 
-        ids = tuple(obj.id for obj in self.objects)
+        if self._objects is None and (self._eq or self._neq):
+            response_data = self.client.update_where(data=data, eq=self._eq, neq=self._neq)
+            return len(response_data)
+
+        if not self.objects:
+            return 0
+
+        ids = [obj.id for obj in self.objects]
         response_data = self.client.bulk_update(ids=ids, data=data)  # pyright: ignore
         return len(response_data)
 
     def delete(self) -> int:
         """
         Delete the objects in the QSet.
+        A QSet that isn't loaded yet is deleted by its filters in a single request, without selecting the objects.
 
         Returns:
             (int): The number of objects deleted.
@@ -74,14 +189,23 @@ class QSet:
             >>> Model.objects.filter(name='name').delete()
         """
 
-        ids = tuple(obj.id for obj in self.objects)
+        if self._objects is None and (self._eq or self._neq):
+            response_data = self.client.delete_where(eq=self._eq, neq=self._neq)
+            self.objects = []
+            return len(response_data)
+
+        if not self.objects:
+            return 0
+
+        ids = [obj.id for obj in self.objects]
         response_data = self.client.bulk_delete(ids=ids)  # pyright: ignore
         self.objects = []
         return len(response_data)
 
     def all(self) -> Self:
         """
-        Get all objects from the database.
+        Get all objects from the database that match the QSet's filters.
+        The objects are selected when they're first used.
 
         Returns:
             (Self): The QSet with all objects.
@@ -90,25 +214,113 @@ class QSet:
             >>> qs = Model.objects.all()
         """
 
-        response_data = self.client.select()
-        self.objects = list(self._model_class(**data) for data in response_data)
-        return self._copy()
+        return self._clone()
+
+    def only(self, *fields: str) -> Self | NoReturn:
+        """
+        Select only the given fields of the objects, so the rest of the columns aren't sent back.
+        The ID is always selected. The other fields are left unset: reading them raises an AttributeError,
+        and saving the objects doesn't write them.
+        If a field is not valid, raise an InvalidField exception.
+
+        Returns:
+            (Self): The QSet with the selected fields.
+
+        Raises:
+            (InvalidField): If the field is not valid.
+
+        Examples:
+            >>> names = [obj.name for obj in Model.objects.filter(age=1).only('name')]
+        """
+
+        invalid_fields = set(fields) - self._model_class._field_names  # pyright: ignore
+        if invalid_fields:
+            raise self.InvalidField(f'Invalid field {", ".join(sorted(invalid_fields))}!')
+
+        fields = tuple(dict.fromkeys(('id', *fields)))
+        return self._clone(fields=fields)
+
+    def _fetch(self) -> Self:
+        """
+        Select the objects from the database with the QSet's filters, unless they're already loaded.
+
+        Returns:
+            (Self): The QSet with the loaded objects.
+        """
+
+        if self._objects is None:
+            self._objects = self._select_objects()
+        return self
+
+    def _select_objects(self, limit: int | None = None, order_by: str | None = None) -> List['BaseSBModel']:
+        """
+        Select objects from the database with the QSet's filters and fields, without loading them into the QSet.
+
+        Args:
+            limit (int | None): The maximum number of objects to select.
+            order_by (str | None): The column to order the records by, prefixed with '-' for descending order.
+
+        Returns:
+            (List[BaseSBModel]): The selected objects.
+        """
+
+        response_data = self.client.select(
+            eq=self._eq,
+            neq=self._neq,
+            limit=limit,
+            columns=self._fields,
+            order_by=order_by,
+        )
+        return self._model_class._from_db_many(response_data, partial=self._fields is not None)
 
-    def _select(self, eq: Dict[str, Any] | None = None, neq: Dict[str, Any] | None = None) -> Self:
+    def _chain(self, eq: Dict[str, Any] | None = None, neq: Dict[str, Any] | None = None) -> Self:
         """
-        Select objects from the database with the equality and non-equality filters.
+        Get a new QSet with the filters added to the QSet's filters, without selecting the objects.
+        A filter on a column that's already filtered by another value can't be merged,
+        so the QSet's objects are filtered in Python instead. The new QSet is detached from the filters,
+        and the QSets chained from it keep filtering its objects in Python.
+        Filtered columns that weren't selected by only are selected too, or fetched for the objects already loaded.
 
         Args:
-            eq (Dict[str, Any] | None): The equality filter.
-            neq (Dict[str, Any] | None): The non-equality filter.
+            eq (Dict[str, Any] | None): The equality filter to add.
+            neq (Dict[str, Any] | None): The non-equality filter to add.
 
         Returns:
-            (Self): The QSet with the selected objects.
+            (Self): The QSet with the combined filters.
         """
 
-        response_data = self.client.select(eq=eq, neq=neq)
-        objects = list(self._model_class(**data) for data in response_data)
-        return self.__class__(model_class=self._model_class, objects=objects)
+        eq, neq = eq or {}, neq or {}
+        merged_eq = {**(self._eq or {}), **eq}
+        merged_neq = {**(self._neq or {}), **neq}
+
+        merged = merged_eq.items() >= (self._eq or {}).items() and merged_neq.items() >= (self._neq or {}).items()
+        if merged and not self._detached:
+            return self._clone(eq=merged_eq or None, neq=merged_neq or None)
+
+        missing = (eq.keys() | neq.keys()) - set(self._fields) if self._fields is not None else None
+        if missing and self._objects is None:
+            return self._clone(fields=(*self._fields, *sorted(missing)))._chain(eq=eq, neq=neq)  # pyright: ignore
+
+        objects = self.objects
+        rows = [obj.__dict__ for obj in objects]
+        if missing:
+            records = self.client.select_in(column='id', values=[obj.id for obj in objects])
+            records = [{column: record[column] for column in ('id', *missing)} for record in records]
+            missing_values = {obj.id: obj.__dict__ for obj in self._model_class._from_db_many(records, partial=True)}
+            # Objects deleted since they were loaded have nothing to match the filters with
+            rows = [
+                {**row, **missing_values[obj.id]} if obj.id in missing_values else None
+                for obj, row in zip(objects, rows)
+            ]
+
+        objects = [
+            obj
+            for obj, row in zip(objects, rows)
+            if row is not None
+            and all(row[column] == value for column, value in eq.items())
+            and all(row[column] != value for column, value in neq.items())
+        ]
+        return self._clone(objects=objects, detached=True)
 
     def _validate_filters(self, **filters) -> None | NoReturn:
         """
@@ -118,13 +330,15 @@ class QSet:
         Raises:
             (InvalidFilter): If a filter is not valid.
         """
-        for filter_name in filters.keys():
-            if filter_name not in self._model_class.model_fields.keys():
-                raise self.InvalidFilter(f'Invalid filter {filter_name}!')
+
+        invalid_filters = filters.keys() - self._model_class._field_names  # pyright: ignore
+        if invalid_filters:
+            raise self.InvalidFilter(f'Invalid filter {", ".join(sorted(invalid_filters))}!')
 
     def filter(self, **filters) -> Self:
         """
         Filter objects from the database with the filters.
+        The filters are added to the QSet's filters, and the objects are selected when they're first used.
 
         Returns:
             (Self): The QSet with the filtered objects.
@@ -134,11 +348,12 @@ class QSet:
         """
 
         self._validate_filters(**filters)
-        return self._select(eq=filters)
+        return self._chain(eq=filters)
 
     def exclude(self, **filters) -> Self:
         """
         Exclude objects from the database with the filters.
+        The filters are added to the QSet's filters, and the objects are selected when they're first used.
 
         Returns:
             (Self): The QSet with the excluded objects.
@@ -148,11 +363,11 @@ class QSet:
         """
 
         self._validate_filters(**filters)
-        return self._select(neq=filters)
+        return self._chain(neq=filters)
 
     def get(self, **filters) -> 'BaseSBModel' | NoReturn:
         """
-        Get an object from the database with the filters.
+        Get an object from the database with the filters, combined with the QSet's filters.
         If the object does not exist, raise a DoesNotExist exception.
         If more than one object exists, raise a MultipleObjectsReturned exception.
 
@@ -167,21 +382,190 @@ class QSet:
         """
 
         self._validate_filters(**filters)
-        result_qs = self._select(eq=filters)
+        q_set = self._chain(eq=filters)
 
-        if not result_qs:
+        # Two objects are enough to tell whether the object is unique
+        objects = q_set._objects if q_set._objects is not None else q_set._select_objects(limit=2)
+
+        if not objects:
             raise self._model_class.DoesNotExist(f'{self._model_class.__name__} object with {filters} does not exist!')
 
-        if result_qs.count() > 1:
+        if len(objects) > 1:
             raise self._model_class.MultipleObjectsReturned(
                 f'For {filters} returned more than 1 {self._model_class.__name__} objects!'
             )
 
-        return result_qs.first()  # pyright: ignore
+        return objects[0]
+
+    def get_or_create(self, defaults: Dict[str, Any] | None = None, **filters) -> Tuple['BaseSBModel', bool]:
+        """
+        Get an object from the database with the filters, or create it if it doesn't exist.
+        The created object is built from the filters and the defaults.
+
+        Args:
+            defaults (Dict[str, Any] | None): The extra data to create the object with.
+
+        Returns:
+            (Tuple[BaseSBModel, bool]): The object and whether it was created.
+
+        Raises:
+            (MultipleObjectsReturned): If more than one object exists.
+
+        Examples:
+            >>> obj, created = Model.objects.get_or_create(name='name', defaults={'age': 1})
+        """
+
+        try:
+            return self.get(**filters), False
+        except self._model_class.DoesNotExist:
+            obj = self._model_class(**{**filters, **(defaults or {})})
+            return obj.save(), True
+
+    async def aall(self) -> Self:
+        """
+        Get all objects from the database without blocking the event loop.
+
+        Returns:
+            (Self): The QSet with all objects.
+
+        Examples:
+            >>> qs = await Model.objects.aall()
+        """
+
+        return await asyncio.to_thread(self.all()._fetch)
+
+    async def afilter(self, **filters) -> Self:
+        """
+        Filter objects from the database without blocking the event loop.
+
+        Returns:
+            (Self): The QSet with the filtered objects.
+
+        Examples:
+            >>> first_qs, second_qs = await asyncio.gather(
+            ...     Model.objects.afilter(name='first'),
+            ...     Model.objects.afilter(name='second'),
+            ... )
+        """
+
+        return await asyncio.to_thread(self.filter(**filters)._fetch)
+
+    async def aexclude(self, **filters) -> Self:
+        """
+        Exclude objects from the database without blocking the event loop.
+
+        Returns:
+            (Self): The QSet with the excluded objects.
+
+        Examples:
+            >>> qs = await Model.objects.aexclude(name='name')
+        """
+
+        return await asyncio.to_thread(self.exclude(**filters)._fetch)
+
+    async def aget(self, **filters) -> 'BaseSBModel' | NoReturn:
+        """
+        Get an object from the database without blocking the event loop.
+
+        Returns:
+            (BaseSBModel): The object.
+
+        Raises:
+            (DoesNotExist): If the object does not exist.
+            (MultipleObjectsReturned): If more than one object exists.
+
+        Examples:
+            >>> obj = await Model.objects.aget(name='name')
+        """
+
+        return await asyncio.to_thread(self.get, **filters)
+
+    async def acount(self) -> int:
+        """
+        Get the number of objects in the QSet without blocking the event loop.
+
+        Returns:
+            (int): The number of objects in the QSet.
+
+        Examples:
+            >>> count = await Model.objects.filter(name='name').acount()
+        """
+
+        return await asyncio.to_thread(self.count)
+
+    async def afirst(self) -> 'BaseSBModel | None':
+        """
+        Get the first object in the QSet without blocking the event loop.
+
+        Returns:
+            (BaseSBModel | None): The first object in the QSet.
+
+        Examples:
+            >>> first_obj = await Model.objects.afirst()
+        """
+
+        return await asyncio.to_thread(self.first)
+
+    async def alast(self) -> 'BaseSBModel | None':
+        """
+        Get the last object in the QSet without blocking the event loop.
+
+        Returns:
+            (BaseSBModel | None): The last object in the QSet.
+
+        Examples:
+            >>> last_obj = await Model.objects.alast()
+        """
+
+        return await asyncio.to_thread(self.last)
+
+    @staticmethod
+    async def gather(*q_sets: 'QSet') -> List['QSet']:
+        """
+        Load the objects of the QSets concurrently without blocking the event loop.
+
+        Args:
+            q_sets (QSet): The QSets to load.
+
+        Returns:
+            (List[QSet]): The loaded QSets, in the same order.
+
+        Examples:
+            >>> first_qs, second_qs = await QSet.gather(
+            ...     Model.objects.filter(name='first'),
+            ...     OtherModel.objects.exclude(name='second'),
+            ... )
+        """
+
+        return await asyncio.gather(*(asyncio.to_thread(q_set._fetch) for q_set in q_sets))
+
+    def get_many(self, ids: Iterable[int]) -> Dict[int, 'BaseSBModel']:
+        """
+        Get objects from the database by their IDs in a single request.
+        IDs without a matching object are missing from the result.
+
+        Args:
+            ids (Iterable[int]): The IDs of the objects.
+
+        Returns:
+            (Dict[int, BaseSBModel]): The objects by their IDs.
+
+        Examples:
+            >>> objs = Model.objects.get_many([1, 2, 3])
+        """
+
+        ids = list(ids)
+        if not ids:
+            return {}
+
+        response_data = self.client.select_in(column='id', values=ids)
+        objects = self._model_class._from_db_many(response_data)
+        return {obj.id: obj for obj in objects}  # pyright: ignore
 
     def count(self) -> int:
         """
         Get the number of objects in the QSet.
+        If the objects aren't loaded, they are counted by the database without fetching them.
 
         Returns:
             (int): The number of objects in the QSet.
@@ -190,12 +574,44 @@ class QSet:
             >>> count = Model.objects.count()
         """
 
-        return len(self.objects)
+        if self._objects is not None:
+            return len(self._objects)
+        return self.client.count(eq=self._eq, neq=self._neq)
+
+    def exists(self) -> bool:
+        """
+        Check whether the QSet has any objects.
+        If the objects aren't loaded, only the ID of a single record is selected.
+
+        Returns:
+            (bool): Whether the QSet has any objects.
+
+        Examples:
+            >>> has_objects = Model.objects.filter(name='name').exists()
+        """
+
+        if self._objects is not None:
+            return bool(self._objects)
+        return bool(self.client.select(eq=self._eq, neq=self._neq, limit=1, columns=('id',)))
+
+    async def aexists(self) -> bool:
+        """
+        Check whether the QSet has any objects without blocking the event loop.
+
+        Returns:
+            (bool): Whether the QSet has any objects.
+
+        Examples:
+            >>> has_objects = await Model.objects.filter(name='name').aexists()
+        """
+
+        return await asyncio.to_thread(self.exists)
 
     def first(self) -> 'BaseSBModel | None':
         """
         Get the first object in the QSet.
         If the QSet is empty, return None.
+        If the objects aren't loaded, only the object with the lowest ID is selected.
 
         Returns:
             (BaseSBModel | None): The first object in the QSet.
@@ -204,13 +620,14 @@ class QSet:
             >>> first_obj = Model.objects.all().first()
         """
 
-        if self.count():
-            return self[0]
+        objects = self._objects if self._objects is not None else self._select_objects(limit=1, order_by='id')
+        return objects[0] if objects else None
 
     def last(self) -> 'BaseSBModel | None':
         """
         Get the last object in the QSet.
         If the QSet is empty, return None.
+        If the objects aren't loaded, only the object with the highest ID is selected.
 
         Returns:
             (BaseSBModel | None): The last object in the QSet.
@@ -219,34 +636,60 @@ class QSet:
             >>> last_obj = Model.objects.all().last()
         """
 
-        if self.count():
-            return self[-1]
+        objects = self._objects if self._objects is not None else self._select_objects(limit=1, order_by='-id')
+        return objects[-1] if objects else None
+
+    def _clone(self, **changes: Any) -> Self:
+        """
+        Get a new QSet with the QSet's filters and fields, but without its objects.
+        The filters are copied, so the QSets never share them. The keyword arguments replace the QSet's state.
+        A detached QSet's objects can't be selected again with its filters, so they're copied too.
+
+        Returns:
+            (Self): The new QSet.
+        """
+
+        state = {
+            'eq': dict(self._eq) if self._eq else None,
+            'neq': dict(self._neq) if self._neq else None,
+            'fields': self._fields,
+            'detached': self._detached,
+            **changes,
+        }
+        if state['detached'] and 'objects' not in changes:
+            state['objects'] = list(self._objects)  # pyright: ignore
+        return self.__class__(model_class=self._model_class, **state)
 
     def _copy(self) -> Self:
         """
-        Copy the QSet.
+        Copy the QSet, including a copy of its loaded objects.
 
         Returns:
             (Self): The copied QSet.
         """
-        return self.__class__(model_class=self._model_class, objects=self.objects)
+
+        return self._clone(objects=list(self._objects) if self._objects is not None else None)
 
     def __iter__(self):
         return iter(self.objects)
 
+    async def __aiter__(self):
+        await asyncio.to_thread(self._fetch)
+        for obj in self.objects:
+            yield obj
+
     def __len__(self) -> int:
         return len(self.objects)
 
     def __getitem__(self, index: int) -> 'BaseSBModel':
-        return list(self)[index]
+        return self.objects[index]
 
     def __repr__(self) -> str:
-        return f'<{self.__class__.__name__} {list(self)} >'
+        return f'<{self.__class__.__name__} {self.objects} >'
 
     def __eq__(self, obj: object) -> bool:
-        return all(
-            (
-                self._model_class == getattr(obj, '_model_class'),
-                self.objects == getattr(obj, 'objects'),
-            )
-        )
+        if self is obj:
+            return True
+        if not isinstance(obj, QSet):
+            return NotImplemented
+        return self._model_class is obj._model_class and self.objects == obj.objects
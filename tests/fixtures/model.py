@@ -25,5 +25,5 @@ def model_mock() -> Type[ModelMock]:
 @pytest.fixture(autouse=True, scope='function')
 def clean_db_cache(model_mock: Type['ModelMock']) -> Generator:
     yield
-    model_mock.objects._cache = {}  # pyright: ignore
+    model_mock._get_db_client()._cache = {}  # pyright: ignore
     model_mock.objects.all().delete()  # pyright: ignore
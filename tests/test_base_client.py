@@ -0,0 +1,103 @@
+from itertools import count
+from typing import Any, Dict, Iterable, List
+
+import pytest
+
+from supadantic.clients.base import BaseClient
+
+
+class DictClient(BaseClient):
+    """Minimal client implementing only the abstract methods of BaseClient."""
+
+    __slots__ = ('records', 'ids')
+
+    def __init__(self, table_name: str) -> None:
+        super().__init__(table_name)
+        self.records: Dict[int, Dict[str, Any]] = {}
+        self.ids = count(1)
+
+    def insert(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        record = {'id': next(self.ids), **data}
+        self.records[record['id']] = record
+        return dict(record)
+
+    def update(self, *, id: int, data: Dict[str, Any], returning: bool = True) -> Dict[str, Any] | None:
+        self.records[id].update(data)
+        return dict(self.records[id]) if returning else None
+
+    def select(
+        self,
+        *,
+        eq: Dict[str, Any] | None = None,
+        neq: Dict[str, Any] | None = None,
+        limit: int | None = None,
+        columns: Iterable[str] | None = None,
+        order_by: str | None = None,
+    ) -> List[Dict[str, Any]]:
+        return [
+            dict(record)
+            for record in self.records.values()
+            if all(record.get(key) == value for key, value in (eq or {}).items())
+            and all(record.get(key) != value for key, value in (neq or {}).items())
+        ]
+
+    def delete(self, *, id: int) -> None:
+        del self.records[id]
+
+    def bulk_update(self, *, ids: Iterable[int], data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return [self.update(id=_id, data=data) for _id in ids]  # pyright: ignore
+
+    def bulk_delete(self, *, ids: Iterable[int]) -> List[Dict[str, Any]]:
+        return [self.records.pop(_id) for _id in list(ids)]
+
+
+class TestBaseClient:
+    @pytest.fixture
+    def client(self) -> DictClient:
+        client = DictClient('custom_table_name')
+        client.records.clear()
+        client.ids = count(1)
+        client.bulk_insert([{'name': 'foo'}, {'name': 'bar'}, {'name': 'foo'}])
+        return client
+
+    def test_bulk_insert(self, client: DictClient):
+        # Testing
+        assert client.select() == [{'id': 1, 'name': 'foo'}, {'id': 2, 'name': 'bar'}, {'id': 3, 'name': 'foo'}]
+
+    def test_count(self, client: DictClient):
+        # Testing
+        assert client.count() == 3
+        assert client.count(eq={'name': 'foo'}) == 2
+        assert client.count(neq={'name': 'foo'}) == 1
+
+    def test_select_in(self, client: DictClient):
+        # Execution
+        response = client.select_in(column='id', values=(1, 3, 4))
+
+        # Testing
+        assert response == [{'id': 1, 'name': 'foo'}, {'id': 3, 'name': 'foo'}]
+
+    def test_update_where(self, client: DictClient):
+        # Execution
+        response = client.update_where(data={'name': 'baz'}, eq={'name': 'foo'})
+
+        # Testing
+        assert response == [{'id': 1, 'name': 'baz'}, {'id': 3, 'name': 'baz'}]
+        assert client.update_where(data={'name': 'baz'}, eq={'name': 'qux'}) == []
+
+    def test_bulk_upsert(self, client: DictClient):
+        # Execution
+        response = client.bulk_upsert([{'id': 2, 'name': 'baz'}, {'id': 5, 'name': 'qux'}])
+
+        # Testing
+        assert response == [{'id': 2, 'name': 'baz'}, {'id': 5, 'name': 'qux'}]
+        assert client.select(eq={'id': 5}) == [{'id': 5, 'name': 'qux'}]
+
+    def test_delete_where(self, client: DictClient):
+        # Execution
+        response = client.delete_where(neq={'name': 'foo'})
+
+        # Testing
+        assert response == [{'id': 2, 'name': 'bar'}]
+        assert client.count() == 2
+        assert client.delete_where(eq={'name': 'qux'}) == []
@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 import pytest
 
 from supadantic.clients import CacheClient
@@ -8,6 +11,25 @@ class TestCacheClient:
     def cache_client(self) -> CacheClient:
         return CacheClient(table_name='table_name')
 
+    def test_singletone(self, cache_client: CacheClient):
+        assert CacheClient('table_name') is cache_client
+        assert CacheClient(table_name='table_name') is cache_client
+        assert CacheClient('other_table_name') is not cache_client
+
+    def test_singletone_is_released(self):
+        # Prepare data
+        client = CacheClient('released_table_name')
+        client.insert({'name': 'name'})
+        client_ref = weakref.ref(client)
+
+        # Execution
+        del client
+        gc.collect()
+
+        # Testing
+        assert client_ref() is None
+        assert CacheClient('released_table_name').select() == []
+
     class TestInsert:
         def test_insert_with_existing_data(self, cache_client: CacheClient):
             # Prepare data
@@ -28,6 +50,44 @@ class TestCacheClient:
             # Testing
             assert response == {'id': 1, 'foo': 'bar'}
 
+        def test_insert_after_delete(self, cache_client: CacheClient):
+            # Prepare data
+            cache_client._cache = {}
+            cache_client.insert({'foo': 'bar'})
+            cache_client.delete(id=1)
+
+            # Execution
+            response = cache_client.insert({'foo': 'test'})
+
+            # Testing
+            assert response == {'id': 2, 'foo': 'test'}
+
+    def test_returned_records_are_copies(self, cache_client: CacheClient):
+        # Prepare data
+        cache_client._cache = {}
+        data = {'foo': 'bar'}
+
+        # Execution
+        record = cache_client.insert(data)
+        record['foo'] = 'test'
+        cache_client.select(eq={'foo': 'bar'})[0]['foo'] = 'test'
+
+        # Testing
+        assert data == {'foo': 'bar'}
+        assert cache_client.select(eq={'foo': 'test'}) == []
+        assert cache_client.select(eq={'foo': 'bar'}) == [{'id': 1, 'foo': 'bar'}]
+
+    def test_bulk_insert(self, cache_client: CacheClient):
+        # Prepare data
+        cache_client._cache = {1: {'id': 1, 'foo': 'bar'}}
+
+        # Execution
+        response = cache_client.bulk_insert([{'foo': 'test'}, {'foo': 'value'}])
+
+        # Testing
+        assert response == [{'id': 2, 'foo': 'test'}, {'id': 3, 'foo': 'value'}]
+        assert cache_client.select(eq={'foo': 'value'}) == [{'id': 3, 'foo': 'value'}]
+
     def test_update(self, cache_client: CacheClient):
         # Prepare data
         cache_client._cache[1] = {'id': 1, 'foo': 'bar'}
@@ -37,6 +97,8 @@ class TestCacheClient:
 
         # Testing
         assert response == {'id': 1, 'foo': 'test'}
+        assert cache_client.select(eq={'foo': 'test'}) == [{'id': 1, 'foo': 'test'}]
+        assert cache_client.select(eq={'foo': 'bar'}) == []
 
     def test_select(self, cache_client: CacheClient):
         # Prepare data
@@ -53,6 +115,155 @@ class TestCacheClient:
         assert cache_client.select(neq={'foo': 'test'}) == [{'id': 1, 'foo': 'bar'}, {'id': 3, 'foo': 'value'}]
         assert cache_client.select(eq={'foo': 'test'}) == [{'id': 2, 'foo': 'test'}, {'id': 4, 'foo': 'test'}]
 
+    def test_select_seeded_by_item(self, cache_client: CacheClient):
+        # Prepare data
+        cache_client._cache = {1: {'id': 1, 'foo': 'bar'}}
+        cache_client.select(eq={'foo': 'bar'})
+
+        # Execution
+        cache_client._cache[1] = {'id': 1, 'foo': 'test'}
+        cache_client._cache[2] = {'id': 2, 'foo': 'bar'}
+
+        # Testing
+        assert cache_client.select(eq={'foo': 'bar'}) == [{'id': 2, 'foo': 'bar'}]
+        assert cache_client.select(eq={'foo': 'test'}) == [{'id': 1, 'foo': 'test'}]
+        assert cache_client.insert({'foo': 'value'}) == {'id': 3, 'foo': 'value'}
+
+    def test_select_removed_by_item(self, cache_client: CacheClient):
+        # Prepare data
+        cache_client._cache = {
+            1: {'id': 1, 'foo': 'bar'},
+            2: {'id': 2, 'foo': 'bar'},
+            3: {'id': 3, 'foo': 'bar'},
+            4: {'id': 4, 'foo': 'test'},
+        }
+        cache_client.select(eq={'foo': 'bar'})
+
+        # Execution
+        del cache_client._cache[1]
+        cache_client._cache.pop(2)
+        cache_client._cache.pop(99, None)
+
+        # Testing
+        assert cache_client.select(eq={'foo': 'bar'}) == [{'id': 3, 'foo': 'bar'}]
+        cache_client._cache.clear()
+        assert cache_client.select(neq={'foo': 'bar'}) == []
+
+    def test_select_seeded_by_update(self, cache_client: CacheClient):
+        # Prepare data
+        cache_client._cache = {1: {'id': 1, 'foo': 'bar'}}
+
+        # Execution
+        cache_client._cache.update({5: {'id': 5, 'foo': 'bar'}})
+        cache_client._cache.setdefault(6, {'id': 6, 'foo': 'test'})
+
+        # Testing
+        assert cache_client.select(eq={'foo': 'bar'}) == [{'id': 1, 'foo': 'bar'}, {'id': 5, 'foo': 'bar'}]
+        assert cache_client.select(eq={'foo': 'test'}) == [{'id': 6, 'foo': 'test'}]
+        assert cache_client.insert({'foo': 'value'}) == {'id': 7, 'foo': 'value'}
+
+    def test_select_with_limit(self, cache_client: CacheClient):
+        # Prepare data
+        cache_client._cache = {
+            1: {'id': 1, 'foo': 'bar'},
+            2: {'id': 2, 'foo': {'test': 2}},
+            3: {'id': 3, 'foo': 'bar'},
+        }
+
+        # Testing
+        assert cache_client.select(eq={'foo': 'bar'}, limit=1) == [{'id': 1, 'foo': 'bar'}]
+        assert cache_client.select(neq={'foo': {'test': 2}}, limit=1) == [{'id': 1, 'foo': 'bar'}]
+        assert cache_client.select(limit=0) == []
+
+    def test_select_with_columns(self, cache_client: CacheClient):
+        # Prepare data
+        cache_client._cache = {
+            1: {'id': 1, 'foo': 'bar', 'bar': 'foo'},
+            2: {'id': 2, 'foo': 'test', 'bar': 'foo'},
+        }
+
+        # Testing
+        assert cache_client.select(eq={'foo': 'bar'}, columns=('id', 'bar')) == [{'id': 1, 'bar': 'foo'}]
+        assert cache_client._cache[1] == {'id': 1, 'foo': 'bar', 'bar': 'foo'}
+
+    def test_select_with_order(self, cache_client: CacheClient):
+        # Prepare data
+        cache_client._cache = {
+            1: {'id': 1, 'foo': 'bar'},
+            2: {'id': 2, 'foo': 'test'},
+            3: {'id': 3, 'foo': 'bar'},
+        }
+
+        # Testing
+        assert cache_client.select(eq={'foo': 'bar'}, order_by='-id', limit=1) == [{'id': 3, 'foo': 'bar'}]
+        assert cache_client.select(order_by='foo', columns=('id',)) == [{'id': 1}, {'id': 3}, {'id': 2}]
+
+    def test_select_query_cache(self, cache_client: CacheClient):
+        # Prepare data
+        cache_client._cache = {1: {'id': 1, 'foo': 'bar'}}
+
+        # Execution
+        first_result = cache_client.select(eq={'foo': 'bar'})
+        cache_client.insert({'foo': 'bar'})
+        second_result = cache_client.select(eq={'foo': 'bar'})
+
+        # Testing
+        assert first_result == [{'id': 1, 'foo': 'bar'}]
+        assert second_result == [{'id': 1, 'foo': 'bar'}, {'id': 2, 'foo': 'bar'}]
+        assert list(cache_client._query_cache.values()) == [[1, 2]]
+
+    def test_select_with_unhashable_value(self, cache_client: CacheClient):
+        # Prepare data
+        cache_client._cache = {
+            1: {'id': 1, 'foo': {'bar': 1}},
+            2: {'id': 2, 'foo': {'test': 2}},
+        }
+
+        # Testing
+        assert cache_client.select(eq={'foo': {'bar': 1}}) == [{'id': 1, 'foo': {'bar': 1}}]
+        assert cache_client.select(neq={'foo': {'bar': 1}}) == [{'id': 2, 'foo': {'test': 2}}]
+
+    def test_select_with_sequence_value(self, cache_client: CacheClient):
+        # Prepare data
+        cache_client._cache = {}
+        cache_client.insert({'foo': ['bar']})
+        cache_client.insert({'foo': ('test',)})
+
+        # Testing
+        assert cache_client.select(eq={'foo': ['bar']}) == [{'id': 1, 'foo': "['bar']"}]
+        assert cache_client.select(neq={'foo': ['bar']}) == [{'id': 2, 'foo': "('test',)"}]
+
+    def test_count(self, cache_client: CacheClient):
+        # Prepare data
+        cache_client._cache = {
+            1: {'id': 1, 'foo': 'bar'},
+            2: {'id': 2, 'foo': {'test': 2}},
+            3: {'id': 3, 'foo': 'bar'},
+        }
+
+        # Testing
+        assert cache_client.count() == 3
+        assert cache_client.count(eq={'foo': 'bar'}) == 2
+        assert cache_client.count(neq={'foo': {'test': 2}}) == 2
+
+    def test_select_in(self, cache_client: CacheClient):
+        # Prepare data
+        cache_client._cache = {
+            1: {'id': 1, 'foo': 'bar'},
+            2: {'id': 2, 'foo': 'test'},
+            3: {'id': 3, 'foo': 'value'},
+        }
+
+        # Testing
+        assert cache_client.select_in(column='id', values=(3, 1, 5)) == [
+            {'id': 3, 'foo': 'value'},
+            {'id': 1, 'foo': 'bar'},
+        ]
+        assert cache_client.select_in(column='foo', values=('test', 'value')) == [
+            {'id': 2, 'foo': 'test'},
+            {'id': 3, 'foo': 'value'},
+        ]
+
     def test_delete(self, cache_client: CacheClient):
         # Prepare data
         cache_client._cache = {}
@@ -63,6 +274,7 @@ class TestCacheClient:
 
         # Testing
         assert cache_client._cache == {}
+        assert cache_client.select(eq={'foo': 'bar'}) == []
 
     def test_bulk_update(self, cache_client: CacheClient):
         # Prepare data
@@ -86,6 +298,77 @@ class TestCacheClient:
             3: {'id': 3, 'foo': 'foo'},
         }
 
+    def test_bulk_update_without_data(self, cache_client: CacheClient):
+        # Prepare data
+        cache_client._cache = {
+            1: {'id': 1, 'foo': 'bar'},
+            2: {'id': 2, 'foo': 'test'},
+        }
+        cache_client.select(eq={'foo': 'bar'})
+
+        # Execution
+        response = cache_client.bulk_update(ids=(1, 2), data={})
+
+        # Testing
+        assert response == [{'id': 1, 'foo': 'bar'}, {'id': 2, 'foo': 'test'}]
+        assert cache_client._query_cache
+
+    def test_update_where(self, cache_client: CacheClient):
+        # Prepare data
+        cache_client._cache = {
+            1: {'id': 1, 'foo': 'bar'},
+            2: {'id': 2, 'foo': 'test'},
+            3: {'id': 3, 'foo': 'bar'},
+        }
+
+        # Execution
+        response = cache_client.update_where(data={'foo': 'foo'}, eq={'foo': 'bar'})
+
+        # Testing
+        assert response == [{'id': 1, 'foo': 'foo'}, {'id': 3, 'foo': 'foo'}]
+        assert cache_client.select(eq={'foo': 'test'}) == [{'id': 2, 'foo': 'test'}]
+
+    def test_delete_where(self, cache_client: CacheClient):
+        # Prepare data
+        cache_client._cache = {
+            1: {'id': 1, 'foo': 'bar'},
+            2: {'id': 2, 'foo': {'test': 2}},
+            3: {'id': 3, 'foo': 'bar'},
+        }
+
+        # Execution
+        response = cache_client.delete_where(neq={'foo': {'test': 2}})
+
+        # Testing
+        assert response == [{'id': 1, 'foo': 'bar'}, {'id': 3, 'foo': 'bar'}]
+        assert cache_client._cache == {2: {'id': 2, 'foo': {'test': 2}}}
+
+    def test_bulk_upsert(self, cache_client: CacheClient):
+        # Prepare data
+        cache_client._cache = {
+            1: {'id': 1, 'foo': 'bar'},
+            2: {'id': 2, 'foo': 'test'},
+        }
+
+        # Execution
+        response = cache_client.bulk_upsert([{'id': 2, 'foo': 'foo'}, {'id': 5, 'foo': ['value']}])
+
+        # Testing
+        assert response == [{'id': 2, 'foo': 'foo'}, {'id': 5, 'foo': "['value']"}]
+        assert cache_client.select(eq={'foo': 'foo'}) == [{'id': 2, 'foo': 'foo'}]
+        assert cache_client.insert({'foo': 'new'}) == {'id': 6, 'foo': 'new'}
+
+    def test_bulk_upsert_fills_missing_columns(self, cache_client: CacheClient):
+        # Prepare data
+        cache_client._cache = {1: {'id': 1, 'foo': 'bar', 'bar': 'foo', 'baz': 'value'}}
+
+        # Execution
+        response = cache_client.bulk_upsert([{'id': 1, 'foo': 'foo'}, {'id': 2, 'bar': 'bar'}])
+
+        # Testing
+        assert response == [{'id': 1, 'foo': 'foo', 'bar': None, 'baz': 'value'}, {'id': 2, 'foo': None, 'bar': 'bar'}]
+        assert cache_client.select(eq={'bar': None}) == [{'id': 1, 'foo': 'foo', 'bar': None, 'baz': 'value'}]
+
     def test_bulk_delete(self, cache_client: CacheClient):
         # Prepare data
         cache_client._cache = {
@@ -1,5 +1,12 @@
-from typing import TYPE_CHECKING, Type
+import asyncio
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Type
 
+import pytest
+from pydantic import ConfigDict, ValidationError, field_validator, model_validator
+from typing_extensions import Self
+
+from supadantic.models import BaseSBModel
 from supadantic.q_set import QSet
 
 
@@ -46,5 +53,199 @@ class TestBaseSBModel:
             assert updated_entity.some_optional_list == ['bar']
             assert updated_entity.some_optional_tuple == ('foo',)
 
+        def test_update_without_refresh(self, model_mock: Type['ModelMock']):
+            # Prepare data
+            model_mock(name='test_name').save()
+            test_entity = model_mock(id=1, name='new_name')
+
+            # Execution
+            saved_entity = test_entity.save(refresh=False)
+
+            # Testing
+            assert saved_entity is test_entity
+            assert model_mock.objects.get(id=1).name == 'new_name'  # pyright: ignore
+
+    def test_asave_and_adelete(self, model_mock: Type['ModelMock']):
+        # Execution
+        saved_entity = asyncio.run(model_mock(name='test_name').asave())
+        asyncio.run(saved_entity.adelete())
+
+        # Testing
+        assert saved_entity.id == 1
+        assert not model_mock.objects.all()  # pyright: ignore
+
+    class TestFromDB:
+        def test_trusted_rows(self):
+            # Prepare data
+            class PlainModel(BaseSBModel):
+                name: str
+                age: int | None = None
+
+            # Execution
+            entity = PlainModel._from_db({'id': 1, 'name': 'test_name'})
+
+            # Testing
+            assert PlainModel._trusted_rows  # pyright: ignore
+            assert entity == PlainModel(id=1, name='test_name')
+
+        def test_trusted_rows_with_arrays(self, model_mock: Type['ModelMock']):
+            # Prepare data
+            data = {'id': 1, 'name': 'test_name', 'some_optional_list': "['foo']", 'some_optional_tuple': ['bar']}
+
+            # Execution
+            entity = model_mock._from_db(data)
+
+            # Testing
+            assert model_mock._trusted_rows  # pyright: ignore
+            assert entity == model_mock(
+                id=1, name='test_name', some_optional_list=['foo'], some_optional_tuple=('bar',)
+            )
+            assert data['some_optional_list'] == "['foo']"
+
+        def test_untrusted_rows(self):
+            # Prepare data
+            class FloatModel(BaseSBModel):
+                score: float
+
+            # Execution
+            entity = FloatModel._from_db({'id': 1, 'score': 1})
+
+            # Testing
+            assert not FloatModel._trusted_rows  # pyright: ignore
+            assert isinstance(entity.score, float)
+
+        def test_untrusted_rows_by_choice(self):
+            # Prepare data
+            class ValidatedModel(BaseSBModel):
+                trust_db_rows = False
+
+                name: str
+
+            # Execution
+            entity = ValidatedModel._from_db({'id': 1, 'name': 'test_name'})
+
+            # Testing
+            assert not ValidatedModel._trusted_rows  # pyright: ignore
+            assert 'trust_db_rows' not in ValidatedModel.model_fields
+            assert entity == ValidatedModel(id=1, name='test_name')
+
+        def test_untrusted_rows_by_config(self):
+            # Prepare data
+            class StrippedModel(BaseSBModel):
+                model_config = ConfigDict(str_strip_whitespace=True)
+
+                name: str
+
+            class StrictModel(BaseSBModel):
+                model_config = ConfigDict(strict=True)
+
+                name: str
+
+            class FrozenModel(BaseSBModel):
+                model_config = ConfigDict(frozen=True, title='Frozen')
+
+                name: str
+
+            # Execution
+            entity = StrippedModel._from_db({'id': 1, 'name': ' test_name '})
+
+            # Testing
+            assert not StrippedModel._trusted_rows  # pyright: ignore
+            assert not StrictModel._trusted_rows  # pyright: ignore
+            assert FrozenModel._trusted_rows  # pyright: ignore
+            assert entity.name == 'test_name'
+
+        def test_json_arrays(self, model_mock: Type['ModelMock']):
+            # Execution
+            entity = model_mock._from_db({'id': 1, 'name': 'test_name', 'some_optional_list': '["foo", "bar"]'})
+
+            # Testing
+            assert entity.some_optional_list == ['foo', 'bar']
+
+        def test_many_untrusted_rows(self):
+            # Prepare data
+            class FloatModel(BaseSBModel):
+                score: float
+                tags: List[str] | None = None
+
+            # Execution
+            entities = FloatModel._from_db_many([{'id': 1, 'score': 1, 'tags': '["foo"]'}, {'id': 2, 'score': 2.5}])
+
+            # Testing
+            assert entities == [FloatModel(id=1, score=1.0, tags=['foo']), FloatModel(id=2, score=2.5)]
+            assert FloatModel._from_db_many([]) == []
+
+        def test_partial_rows(self):
+            # Prepare data
+            class FloatModel(BaseSBModel):
+                score: float
+                tags: List[str] | None = None
+                at: datetime | None = None
+
+            # Execution
+            entities = FloatModel._from_db_many(
+                [{'id': 1, 'tags': '["foo"]'}, {'id': 2, 'score': 1, 'at': '2024-01-01T00:00:00'}], partial=True
+            )
+
+            # Testing
+            assert entities[0].tags == ['foo']
+            assert entities[0].model_fields_set == {'id', 'tags'}
+            assert entities[0]._get_save_data() == {'tags': ['foo']}
+            assert entities[1].__dict__ == {'id': 2, 'score': 1.0, 'at': datetime(2024, 1, 1)}
+            assert isinstance(entities[1].score, float)
+
+        def test_partial_rows_with_validators(self):
+            # Prepare data
+            class ValidatedModel(BaseSBModel):
+                model_config = ConfigDict(str_strip_whitespace=True)
+
+                name: str
+                age: int
+
+                @field_validator('name')
+                @classmethod
+                def _upper_name(cls, value: str) -> str:
+                    return value.upper()
+
+                @model_validator(mode='after')
+                def _check_age(self) -> Self:
+                    if self.age < 0:
+                        raise ValueError('Negative age!')
+                    return self
+
+            # Execution
+            entities = ValidatedModel._from_db_many([{'id': 1, 'name': ' foo '}], partial=True)
+
+            # Testing
+            assert entities[0].__dict__ == {'id': 1, 'name': 'FOO'}
+            with pytest.raises(ValidationError):
+                ValidatedModel._from_db_many([{'id': 1, 'age': 'foo'}], partial=True)
+
+    def test_array_fields(self, model_mock: Type['ModelMock']):
+        assert model_mock._array_fields == {'some_optional_list', 'some_optional_tuple'}  # pyright: ignore
+
+    def test_get_save_data(self, model_mock: Type['ModelMock']):
+        # Prepare data
+        entity = model_mock(id=1, name='test_name', some_optional_tuple=('foo',))
+
+        # Testing
+        assert model_mock._plain_dump  # pyright: ignore
+        assert entity._get_save_data() == entity.model_dump(exclude={'id'})
+
+    def test_get_db_client(self, model_mock: Type['ModelMock']):
+        assert model_mock._get_db_client() is model_mock._get_db_client()
+        assert model_mock._get_db_client().table_name == 'model_mock'
+
+    def test_get_table_name(self, model_mock: Type['ModelMock']):
+        # Prepare data
+        class ChildModelMock(model_mock):
+            pass
+
+        # Testing
+        assert model_mock._get_table_name() == 'model_mock'
+        assert ChildModelMock._get_table_name() == 'child_model_mock'
+
     def test_objects(self, model_mock: Type['ModelMock']):
         assert isinstance(model_mock.objects, QSet)  # pyright: ignore
+        assert model_mock.objects is not model_mock.objects  # pyright: ignore
+        assert isinstance(model_mock(name='test_name').objects, QSet)  # pyright: ignore
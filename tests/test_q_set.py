@@ -1,7 +1,10 @@
+import asyncio
 from typing import TYPE_CHECKING, Type
+from unittest.mock import patch
 
 import pytest
 
+from supadantic.clients import CacheClient
 from supadantic.q_set import QSet
 
 
@@ -20,13 +23,60 @@ class TestQSet:
         def test(self, model_mock: Type['ModelMock']):
             assert model_mock.objects.filter(name='test_name').update(name='_test_name') == 2  # pyright: ignore
 
+        def test_empty(self, model_mock: Type['ModelMock']):
+            assert model_mock.objects.filter(name='name').update(name='new_name') == 0  # pyright: ignore
+
         def test_with_invalid_field(self, model_mock: Type['ModelMock']):
             with pytest.raises(QSet.InvalidField, match='Invalid field'):
                 model_mock.objects.filter(name='name').update(foo='bar')  # pyright: ignore
 
+    def test_bulk_create(self, model_mock: Type['ModelMock']):
+        # Execution
+        created = model_mock.objects.bulk_create(  # pyright: ignore
+            [model_mock(name='first'), model_mock(name='second', some_optional_list=['foo'])]
+        )
+
+        # Testing
+        assert created == [
+            model_mock(id=5, name='first'),
+            model_mock(id=6, name='second', some_optional_list=['foo']),
+        ]
+        assert model_mock.objects.all().count() == 6  # pyright: ignore
+        assert model_mock.objects.bulk_create([]) == []  # pyright: ignore
+
+    def test_bulk_save(self, model_mock: Type['ModelMock']):
+        # Execution
+        saved = model_mock.objects.bulk_save(  # pyright: ignore
+            [model_mock(id=2, name='updated_name'), model_mock(name='new'), model_mock(id=4, name='other_name')]
+        )
+
+        # Testing
+        assert saved == [
+            model_mock(id=2, name='updated_name'),
+            model_mock(id=5, name='new'),
+            model_mock(id=4, name='other_name'),
+        ]
+        assert model_mock.objects.get(id=2).name == 'updated_name'  # pyright: ignore
+        assert model_mock.objects.bulk_save([]) == []  # pyright: ignore
+
+    def test_eq(self, model_mock: Type['ModelMock']):
+        # Prepare data
+        q_set = model_mock.objects.all()  # pyright: ignore
+
+        # Testing
+        assert q_set == q_set
+        assert q_set == QSet(model_class=model_mock, objects=list(q_set))
+        assert q_set != QSet(model_class=model_mock, objects=[])
+        assert q_set != list(q_set)
+
     def test_delete(self, model_mock: Type['ModelMock']):
         assert model_mock.objects.all().delete() == 4  # pyright: ignore
         assert not model_mock.objects.all()  # pyright: ignore
+        assert model_mock.objects.filter(name='test_name').delete() == 0  # pyright: ignore
+
+    def test_delete_by_filters(self, model_mock: Type['ModelMock']):
+        assert model_mock.objects.exclude(name='test_name').delete() == 2  # pyright: ignore
+        assert model_mock.objects.count() == 2  # pyright: ignore
 
     def test_all(self, model_mock: Type['ModelMock']):
         # Prepare data
@@ -79,10 +129,151 @@ class TestQSet:
             # Testing
             assert actual_q_set == expected_q_set
 
+        def test_chained_filters(self, model_mock: Type['ModelMock']):
+            # Prepare data
+            client = model_mock._get_db_client()
+
+            # Execution
+            with patch.object(CacheClient, 'select', autospec=True, side_effect=CacheClient.select) as select_mock:
+                q_set = model_mock.objects.filter(name='test_name').exclude(id=1).all()  # pyright: ignore
+                objects = list(q_set)
+
+            # Testing
+            select_mock.assert_called_once_with(
+                client, eq={'name': 'test_name'}, neq={'id': 1}, limit=None, columns=None, order_by=None
+            )
+            assert objects == [model_mock(id=3, name='test_name')]
+
+        def test_conflicting_filters(self, model_mock: Type['ModelMock']):
+            assert not model_mock.objects.filter(name='test_name').filter(name='new_name')  # pyright: ignore
+            assert model_mock.objects.exclude(name='test_name').exclude(name='new_name') == QSet(  # pyright: ignore
+                model_class=model_mock, objects=[model_mock(id=2, name='unique_name')]
+            )
+
+        def test_chained_after_conflicting_filters(self, model_mock: Type['ModelMock']):
+            # Prepare data
+            empty_q_set = model_mock.objects.filter(name='test_name').filter(name='new_name')  # pyright: ignore
+            excluded_q_set = model_mock.objects.exclude(name='test_name').exclude(name='new_name')  # pyright: ignore
+
+            # Testing
+            assert not empty_q_set.filter(id=1)
+            assert empty_q_set.filter(id=1).count() == 0
+            assert empty_q_set.exclude(id=99).delete() == 0
+            assert empty_q_set.exclude(id=99).update(name='updated_name') == 0
+            assert excluded_q_set.filter(id=4).count() == 0
+            assert excluded_q_set.get(id=2) == model_mock(id=2, name='unique_name')
+
+            with pytest.raises(model_mock.DoesNotExist, match='does not exist!'):
+                excluded_q_set.get(id=4)
+
+            assert not empty_q_set.all().exists()
+            assert empty_q_set.all().only('name').count() == 0
+            assert empty_q_set.all().first() is None
+            assert excluded_q_set.all().last() == model_mock(id=2, name='unique_name')
+            assert excluded_q_set.all().exclude(id=99).delete() == 1
+
+            assert model_mock.objects.count() == 3  # pyright: ignore
+            assert model_mock.objects.filter(name='updated_name').count() == 0  # pyright: ignore
+
+        def test_only_with_conflicting_filters(self, model_mock: Type['ModelMock']):
+            # Prepare data
+            q_set = model_mock.objects.only('some_optional_list')  # pyright: ignore
+
+            # Execution
+            excluded_q_set = q_set.exclude(name='test_name').exclude(name='new_name')
+
+            # Testing
+            assert [obj.id for obj in excluded_q_set] == [2]
+            assert [obj.id for obj in excluded_q_set.filter(some_optional_tuple=None)] == [2]
+            assert not excluded_q_set.exclude(some_optional_tuple=None)
+
         def test_filters_with_wrong_field(self, model_mock: Type['ModelMock']):
             with pytest.raises(QSet.InvalidFilter, match='Invalid filter'):
                 model_mock.objects.filter(foo='bar')  # pyright: ignore
 
+    def test_only(self, model_mock: Type['ModelMock']):
+        # Execution
+        objects = list(model_mock.objects.filter(name='test_name').only('name'))  # pyright: ignore
+
+        # Testing
+        assert [(obj.id, obj.name) for obj in objects] == [(1, 'test_name'), (3, 'test_name')]
+        assert objects[0].model_fields_set == {'id', 'name'}
+
+        with pytest.raises(QSet.InvalidField, match='Invalid field foo'):
+            model_mock.objects.only('foo')  # pyright: ignore
+
+    def test_save_only(self, model_mock: Type['ModelMock']):
+        # Prepare data
+        model_mock(name='listed_name', some_optional_list=['foo']).save()
+        obj = model_mock.objects.filter(id=5).only('name').first()  # pyright: ignore
+
+        # Execution
+        obj.name = 'updated_name'  # pyright: ignore
+        obj.save()  # pyright: ignore
+
+        # Testing
+        assert model_mock.objects.get(id=5) == model_mock(  # pyright: ignore
+            id=5, name='updated_name', some_optional_list=['foo']
+        )
+        with pytest.raises(AttributeError):
+            obj.some_optional_list  # pyright: ignore
+
+    def test_bulk_save_only(self, model_mock: Type['ModelMock']):
+        # Prepare data
+        model_mock(name='listed_name', some_optional_list=['foo']).save()
+        partial = model_mock.objects.filter(id=5).only('name').first()  # pyright: ignore
+        partial.name = 'updated_name'  # pyright: ignore
+
+        # Execution
+        saved = model_mock.objects.bulk_save([partial, model_mock(id=2, name='other_name')])  # pyright: ignore
+
+        # Testing
+        assert saved == [
+            model_mock(id=5, name='updated_name', some_optional_list=['foo']),
+            model_mock(id=2, name='other_name'),
+        ]
+        assert model_mock.objects.get(id=5).some_optional_list == ['foo']  # pyright: ignore
+
+    def test_async_lookups(self, model_mock: Type['ModelMock']):
+        # Prepare data
+        async def _lookup():
+            return await asyncio.gather(
+                model_mock.objects.aall(),  # pyright: ignore
+                model_mock.objects.afilter(name='test_name'),  # pyright: ignore
+                model_mock.objects.aexclude(name='test_name'),  # pyright: ignore
+                model_mock.objects.aget(id=2),  # pyright: ignore
+            )
+
+        # Execution
+        all_qs, filtered_qs, excluded_qs, obj = asyncio.run(_lookup())
+
+        # Testing
+        assert all_qs.count() == 4
+        assert filtered_qs.count() == 2
+        assert excluded_qs.count() == 2
+        assert obj == model_mock(id=2, name='unique_name')
+
+    def test_async_results(self, model_mock: Type['ModelMock']):
+        # Prepare data
+        async def _results():
+            count, first, last, (q_set,) = await asyncio.gather(
+                model_mock.objects.filter(name='test_name').acount(),  # pyright: ignore
+                model_mock.objects.afirst(),  # pyright: ignore
+                model_mock.objects.alast(),  # pyright: ignore
+                QSet.gather(model_mock.objects.exclude(name='test_name')),  # pyright: ignore
+            )
+            return count, first, last, q_set, [obj async for obj in model_mock.objects.filter(id=2)]  # pyright: ignore
+
+        # Execution
+        count, first, last, q_set, objects = asyncio.run(_results())
+
+        # Testing
+        assert count == 2
+        assert first == model_mock(id=1, name='test_name')
+        assert last == model_mock(id=4, name='new_name')
+        assert q_set._objects == [model_mock(id=2, name='unique_name'), model_mock(id=4, name='new_name')]
+        assert objects == [model_mock(id=2, name='unique_name')]
+
     def test_get(self, model_mock: Type['ModelMock']):
         assert model_mock.objects.get(id=1) == model_mock(id=1, name='test_name')  # pyright: ignore
 
@@ -92,14 +283,62 @@ class TestQSet:
         with pytest.raises(model_mock.MultipleObjectsReturned, match='returned more than 1'):
             model_mock.objects.get(name='test_name')  # pyright: ignore
 
+    def test_get_with_filters(self, model_mock: Type['ModelMock']):
+        # Prepare data
+        expected_obj = model_mock(id=3, name='test_name')
+
+        # Testing
+        assert model_mock.objects.filter(name='test_name').get(id=3) == expected_obj  # pyright: ignore
+        assert model_mock.objects.exclude(id=1).get(name='test_name') == expected_obj  # pyright: ignore
+
+        with pytest.raises(model_mock.DoesNotExist, match='does not exist!'):
+            model_mock.objects.filter(name='test_name').get(id=2)  # pyright: ignore
+
+        with pytest.raises(model_mock.DoesNotExist, match='does not exist!'):
+            model_mock.objects.filter(id=1).get(id=3)  # pyright: ignore
+
+    def test_get_or_create(self, model_mock: Type['ModelMock']):
+        # Execution
+        existing, existing_created = model_mock.objects.get_or_create(name='unique_name')  # pyright: ignore
+        created, created_created = model_mock.objects.get_or_create(  # pyright: ignore
+            name='created_name', defaults={'some_optional_list': ['foo']}
+        )
+
+        # Testing
+        assert (existing, existing_created) == (model_mock(id=2, name='unique_name'), False)
+        assert (created, created_created) == (
+            model_mock(id=5, name='created_name', some_optional_list=['foo']),
+            True,
+        )
+
+    def test_get_many(self, model_mock: Type['ModelMock']):
+        assert model_mock.objects.get_many([1, 4, 5]) == {  # pyright: ignore
+            1: model_mock(id=1, name='test_name'),
+            4: model_mock(id=4, name='new_name'),
+        }
+        assert model_mock.objects.get_many([]) == {}  # pyright: ignore
+
     def test_count(self, model_mock: Type['ModelMock']):
-        model_mock.objects.count() == 4  # pyright: ignore
+        assert model_mock.objects.count() == 4  # pyright: ignore
+        assert model_mock.objects.filter(name='test_name').count() == 2  # pyright: ignore
+        assert QSet(model_class=model_mock, objects=[model_mock(id=1, name='name')]).count() == 1
+
+    def test_exists(self, model_mock: Type['ModelMock']):
+        assert model_mock.objects.filter(name='test_name').exists()  # pyright: ignore
+        assert not model_mock.objects.filter(name='name').exists()  # pyright: ignore
+        assert not QSet(model_class=model_mock, objects=[]).exists()
+        assert asyncio.run(model_mock.objects.aexists())  # pyright: ignore
 
     def test_first(self, model_mock: Type['ModelMock']):
         assert model_mock.objects.all().first() == model_mock(id=1, name='test_name')  # pyright: ignore
+        assert model_mock.objects.exclude(id=1).first() == model_mock(id=2, name='unique_name')  # pyright: ignore
+        assert model_mock.objects.filter(name='name').first() is None  # pyright: ignore
+        assert QSet(model_class=model_mock, objects=[model_mock(id=3, name='name')]).first().id == 3  # pyright: ignore
 
     def test_last(self, model_mock: Type['ModelMock']):
         assert model_mock.objects.all().last() == model_mock(id=4, name='new_name')  # pyright: ignore
+        assert model_mock.objects.exclude(id=4).last() == model_mock(id=3, name='test_name')  # pyright: ignore
+        assert model_mock.objects.filter(name='name').last() is None  # pyright: ignore
 
     def test_copy(self, model_mock: Type['ModelMock']):
         assert QSet(
@@ -115,3 +354,19 @@ class TestQSet:
                 model_mock(id=2, name='second'),
             ],
         )
+
+    def test_copy_is_independent(self, model_mock: Type['ModelMock']):
+        # Prepare data
+        q_set = model_mock.objects.filter(name='test_name')  # pyright: ignore
+        q_set.objects
+
+        # Execution
+        copied_q_set = q_set._copy()
+        filtered_q_set = q_set.filter(id=1)
+
+        # Testing
+        assert copied_q_set == q_set
+        assert copied_q_set._objects is not q_set._objects
+        assert copied_q_set._eq is not q_set._eq
+        assert filtered_q_set._objects is None
+        assert q_set._eq == {'name': 'test_name'}
@@ -9,12 +9,23 @@ from supadantic.clients import SupabaseClient
 class TestSupabaseClient:
     @pytest.fixture(autouse=True)
     def mock_create_client(self, mocker: MockerFixture) -> MagicMock:
+        mocker.patch.dict('supadantic.clients.supabase._supabase_clients', clear=True)
         return mocker.patch('supadantic.clients.supabase.create_client')
 
     @pytest.fixture
     def supabase_client(self) -> SupabaseClient:
         return SupabaseClient(table_name='table_name')
 
+    def test_supabase_client_is_shared(self, mock_create_client: MagicMock, supabase_client: SupabaseClient):
+        # Execution
+        other_client = SupabaseClient(table_name='other_table_name')
+
+        # Testing
+        mock_create_client.assert_called_once()
+        assert other_client is not supabase_client
+        mock_create_client.return_value.table.assert_any_call(table_name='table_name')
+        mock_create_client.return_value.table.assert_any_call(table_name='other_table_name')
+
     def test_insert(self, supabase_client: SupabaseClient):
         # Prepare data
         mock_supabase_query = Mock()
@@ -35,6 +46,27 @@ class TestSupabaseClient:
         mock_supabase_query.insert.assert_called_once_with(test_data)
         assert response == test_data
 
+    def test_bulk_insert(self, supabase_client: SupabaseClient):
+        # Prepare data
+        mock_supabase_query = Mock()
+
+        supabase_client.query = mock_supabase_query
+
+        test_data = [{'name': 'first'}, {'name': 'second'}]
+        test_response = [{'id': 1, 'name': 'first'}, {'id': 2, 'name': 'second'}]
+
+        mock_response = Mock()
+        type(mock_response).data = PropertyMock(return_value=test_response)
+
+        mock_supabase_query.insert.return_value.execute.return_value = mock_response
+
+        # Execution
+        result = supabase_client.bulk_insert(test_data)
+
+        # Testing
+        mock_supabase_query.insert.assert_called_once_with(test_data)
+        assert result == test_response
+
     def test_update(self, supabase_client: SupabaseClient):
         # Prepare data
         mock_supabase_query = Mock()
@@ -58,6 +90,23 @@ class TestSupabaseClient:
 
         assert response == test_data_with_id
 
+    def test_update_without_returning(self, supabase_client: SupabaseClient):
+        # Prepare data
+        mock_supabase_query = Mock()
+        supabase_client.query = mock_supabase_query
+
+        test_data = {'test': 'data'}
+
+        # Execution
+        response = supabase_client.update(id=1, data=test_data, returning=False)
+
+        # Testing
+        mock_supabase_query.update.assert_called_once_with(test_data, returning='minimal')
+        mock_supabase_query.update.return_value.eq.assert_called_once_with('id', 1)
+        mock_supabase_query.update.return_value.eq.return_value.execute.assert_called_once()
+
+        assert response is None
+
     def test_select(self, supabase_client: SupabaseClient):
         # Prepare data
         mock_supabase_query = Mock()
@@ -69,20 +118,146 @@ class TestSupabaseClient:
         mock_response = Mock()
         type(mock_response).data = PropertyMock(return_value=[{'id': 1}, {'id': 2}])
 
-        mock_supabase_query.select.return_value.eq.return_value.eq.return_value.execute.return_value = mock_response
+        mock_supabase_query.select.return_value.match.return_value.neq.return_value.execute.return_value = mock_response
 
         # Execution
-        result = supabase_client.select(eq=test_filters)
+        result = supabase_client.select(eq=test_filters, neq={'column3': 'value3'})
 
         # Testing
         mock_supabase_query.select.assert_called_with('*')
 
-        mock_supabase_query.select.return_value.eq.assert_called_with('column1', 'value1')
-        mock_supabase_query.select.return_value.eq.return_value.eq.assert_called_with('column2', 'value2')
+        mock_supabase_query.select.return_value.match.assert_called_once_with(test_filters)
+        mock_supabase_query.select.return_value.match.return_value.neq.assert_called_once_with('column3', 'value3')
 
         # Assert the result
         assert result == [{'id': 1}, {'id': 2}]
 
+    def test_select_with_limit(self, supabase_client: SupabaseClient):
+        # Prepare data
+        mock_supabase_query = Mock()
+        supabase_client.query = mock_supabase_query
+
+        mock_response = Mock()
+        type(mock_response).data = PropertyMock(return_value=[{'id': 1}, {'id': 2}])
+
+        mock_supabase_query.select.return_value.match.return_value.limit.return_value.execute.return_value = (
+            mock_response
+        )
+
+        # Execution
+        result = supabase_client.select(eq={'column': 'value'}, limit=2)
+
+        # Testing
+        mock_supabase_query.select.return_value.match.return_value.limit.assert_called_once_with(2)
+        assert result == [{'id': 1}, {'id': 2}]
+
+    def test_select_with_order(self, supabase_client: SupabaseClient):
+        # Prepare data
+        mock_supabase_query = Mock()
+        supabase_client.query = mock_supabase_query
+
+        mock_response = Mock()
+        type(mock_response).data = PropertyMock(return_value=[{'id': 2}])
+
+        mock_supabase_query.select.return_value.order.return_value.limit.return_value.execute.return_value = (
+            mock_response
+        )
+
+        # Execution
+        result = supabase_client.select(order_by='-id', limit=1)
+
+        # Testing
+        mock_supabase_query.select.return_value.order.assert_called_once_with('id', desc=True)
+        mock_supabase_query.select.return_value.order.return_value.limit.assert_called_once_with(1)
+        assert result == [{'id': 2}]
+
+    def test_select_with_columns(self, supabase_client: SupabaseClient):
+        # Prepare data
+        mock_supabase_query = Mock()
+        supabase_client.query = mock_supabase_query
+
+        mock_response = Mock()
+        type(mock_response).data = PropertyMock(return_value=[{'id': 1, 'name': 'name'}])
+
+        mock_supabase_query.select.return_value.execute.return_value = mock_response
+
+        # Execution
+        result = supabase_client.select(columns=('id', 'name'))
+
+        # Testing
+        mock_supabase_query.select.assert_called_once_with('id', 'name')
+        assert result == [{'id': 1, 'name': 'name'}]
+
+    def test_count(self, supabase_client: SupabaseClient):
+        # Prepare data
+        mock_supabase_query = Mock()
+        supabase_client.query = mock_supabase_query
+
+        mock_response = Mock()
+        type(mock_response).count = PropertyMock(return_value=2)
+
+        mock_select = mock_supabase_query.select.return_value
+        mock_select.match.return_value.neq.return_value.execute.return_value = mock_response
+
+        # Execution
+        result = supabase_client.count(eq={'column': 'value'}, neq={'other_column': 'value'})
+
+        # Testing
+        mock_supabase_query.select.assert_called_once_with('id', count='exact', head=True)
+        mock_select.match.assert_called_once_with({'column': 'value'})
+        mock_select.match.return_value.neq.assert_called_once_with('other_column', 'value')
+        assert result == 2
+
+    def test_select_in(self, supabase_client: SupabaseClient):
+        # Prepare data
+        mock_supabase_query = Mock()
+        supabase_client.query = mock_supabase_query
+
+        mock_response = Mock()
+        type(mock_response).data = PropertyMock(return_value=[{'id': 1}, {'id': 3}])
+
+        mock_supabase_query.select.return_value.in_.return_value.execute.return_value = mock_response
+
+        # Execution
+        result = supabase_client.select_in(column='id', values=(1, 3))
+
+        # Testing
+        mock_supabase_query.select.assert_called_once_with('*')
+        mock_supabase_query.select.return_value.in_.assert_called_once_with('id', [1, 3])
+
+        assert result == [{'id': 1}, {'id': 3}]
+
+    def test_select_in_single_value(self, supabase_client: SupabaseClient):
+        # Prepare data
+        mock_supabase_query = Mock()
+        supabase_client.query = mock_supabase_query
+
+        mock_response = Mock()
+        type(mock_response).data = PropertyMock(return_value=[{'id': 1}])
+
+        mock_supabase_query.select.return_value.eq.return_value.execute.return_value = mock_response
+
+        # Execution
+        result = supabase_client.select_in(column='id', values=[1])
+
+        # Testing
+        mock_supabase_query.select.return_value.eq.assert_called_once_with('id', 1)
+        mock_supabase_query.select.return_value.in_.assert_not_called()
+
+        assert result == [{'id': 1}]
+
+    def test_select_in_no_values(self, supabase_client: SupabaseClient):
+        # Prepare data
+        mock_supabase_query = Mock()
+        supabase_client.query = mock_supabase_query
+
+        # Execution
+        result = supabase_client.select_in(column='id', values=[])
+
+        # Testing
+        mock_supabase_query.select.assert_not_called()
+        assert result == []
+
     def test_delete(self, supabase_client: SupabaseClient):
         # Prepare_data
         mock_supabase_query = Mock()
@@ -123,6 +298,66 @@ class TestSupabaseClient:
 
         assert result == test_response
 
+    def test_update_where(self, supabase_client: SupabaseClient):
+        # Prepare data
+        mock_supabase_query = Mock()
+        supabase_client.query = mock_supabase_query
+
+        test_data = {'name': 'new_name'}
+        test_response = [{'id': 1, 'name': 'new_name'}]
+
+        mock_response = Mock()
+        type(mock_response).data = PropertyMock(return_value=test_response)
+
+        mock_supabase_query.update.return_value.match.return_value.execute.return_value = mock_response
+
+        # Execution
+        result = supabase_client.update_where(data=test_data, eq={'name': 'name'})
+
+        # Testing
+        mock_supabase_query.update.assert_called_once_with(test_data)
+        mock_supabase_query.update.return_value.match.assert_called_once_with({'name': 'name'})
+        assert result == test_response
+
+    def test_delete_where(self, supabase_client: SupabaseClient):
+        # Prepare data
+        mock_supabase_query = Mock()
+        supabase_client.query = mock_supabase_query
+
+        test_response = [{'id': 1, 'name': 'name'}]
+
+        mock_response = Mock()
+        type(mock_response).data = PropertyMock(return_value=test_response)
+
+        mock_supabase_query.delete.return_value.neq.return_value.execute.return_value = mock_response
+
+        # Execution
+        result = supabase_client.delete_where(neq={'name': 'other_name'})
+
+        # Testing
+        mock_supabase_query.delete.assert_called_once_with()
+        mock_supabase_query.delete.return_value.neq.assert_called_once_with('name', 'other_name')
+        assert result == test_response
+
+    def test_bulk_upsert(self, supabase_client: SupabaseClient):
+        # Prepare data
+        mock_supabase_query = Mock()
+        supabase_client.query = mock_supabase_query
+
+        test_data = [{'id': 1, 'name': 'first'}, {'id': 2, 'name': 'second'}]
+
+        mock_response = Mock()
+        type(mock_response).data = PropertyMock(return_value=test_data)
+
+        mock_supabase_query.upsert.return_value.execute.return_value = mock_response
+
+        # Execution
+        result = supabase_client.bulk_upsert(test_data)
+
+        # Testing
+        mock_supabase_query.upsert.assert_called_once_with(test_data)
+        assert result == test_data
+
     def test_bulk_delete(self, supabase_client: SupabaseClient):
         # Prepare data
         mock_supabase_query = Mock()